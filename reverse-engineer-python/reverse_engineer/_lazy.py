@@ -0,0 +1,42 @@
+"""
+Lazy package exports (PEP 562).
+
+A package maps each exported name to the submodule that defines it and
+installs the returned hooks as its module-level ``__getattr__`` and
+``__dir__``::
+
+    _LAZY_IMPORTS = {"HTMLExporter": ".html_exporter"}
+    __getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+"""
+
+import importlib
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, namespace: dict[str, Any], imports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Build ``__getattr__`` and ``__dir__`` hooks for a package.
+
+    Args:
+        package: The package's ``__name__``
+        namespace: The package's ``globals()``
+        imports: Exported name to relative module path
+
+    Returns:
+        The (``__getattr__``, ``__dir__``) pair for the package
+    """
+
+    def __getattr__(name: str) -> Any:
+        module_name = imports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Cache on the package so later lookups skip this hook
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(imports))
+
+    return __getattr__, __dir__
@@ -605,7 +605,9 @@ class UseCaseNamer:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-        content = config_path.read_text()
+        # Raw bytes: both parsers detect the UTF encoding themselves, and
+        # libyaml scans the buffer without a Python text decoding pass
+        content = config_path.read_bytes()
 
         if config_path.suffix in [".yaml", ".yml"]:
             try:
@@ -615,7 +617,8 @@ class UseCaseNamer:
                     "PyYAML is required to load YAML configuration files. "
                     "Install it with: pip install pyyaml"
                 ) from e
-            data = yaml.safe_load(content)
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(content, Loader=loader)
         elif config_path.suffix == ".json":
             data = json.loads(content)
         else:
@@ -25,6 +25,7 @@ various analysis components to extract information from projects.
     See docs/developer-guides/legacy-analyzer-deprecation.md for full migration guide.
 """
 
+import functools
 import re
 import sys
 import warnings
@@ -97,6 +98,21 @@ if PLUGIN_ARCHITECTURE_AVAILABLE:
         pass
 
 
+def _analysis_step(method):
+    """Record that an analysis step started so ensure_full_analysis() can skip it.
+
+    A step is recorded before it runs: one that fails partway has already
+    appended some results, and running it again would append them twice.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self._started_steps.add(method.__name__)
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ProjectAnalyzer:
     """
     Analyzes a project to discover its components.
@@ -202,6 +218,9 @@ class ProjectAnalyzer:
         # Relationship mapping results from RelationshipMapper
         self.relationship_mapping_results: dict = {}
 
+        # Names of analysis steps that have already run successfully
+        self._started_steps: set[str] = set()
+
         # Initialize the AI-enhanced use case namer
         if naming_config:
             self.use_case_namer = UseCaseNamer(config=naming_config, verbose=verbose)
@@ -403,6 +422,28 @@ class ProjectAnalyzer:
         self.map_relationships()
         self.extract_use_cases()
 
+    def ensure_full_analysis(self):
+        """Run the discovery steps that have not been started yet.
+
+        Steps that already ran, through analyze() or a direct call, are
+        skipped even if they failed partway, so the collected endpoints,
+        models, views, services and features are not appended a second time.
+        """
+        steps = (
+            self.discover_endpoints,
+            self.discover_models,
+            self.discover_views,
+            self.discover_services,
+            self.extract_features,
+            self.discover_actors,
+            self.discover_system_boundaries,
+            self.map_relationships,
+            self.extract_use_cases,
+        )
+        for step in steps:
+            if step.__name__ not in self._started_steps:
+                step()
+
     def request_cancellation(self) -> None:
         """Request cancellation of the current analysis."""
         self.progress_tracker.request_cancellation()
@@ -415,6 +456,7 @@ class ProjectAnalyzer:
         """Get a summary of the current analysis progress."""
         return self.progress_tracker.get_summary()
 
+    @_analysis_step
     def discover_endpoints(self):
         """Discover API endpoints from Java controllers."""
         log_info("Discovering API endpoints...", self.verbose)
@@ -537,6 +579,7 @@ class ProjectAnalyzer:
                 self.endpoints.append(endpoint)
                 log_info(f"    → {endpoint}", self.verbose)
 
+    @_analysis_step
     def discover_models(self):
         """Discover data models."""
         log_info("Discovering data models...", self.verbose)
@@ -572,6 +615,7 @@ class ProjectAnalyzer:
         model = Model(name=model_name, fields=field_count, file_path=file_path)
         self.models.append(model)
 
+    @_analysis_step
     def discover_views(self):
         """Discover Vue.js views and components."""
         log_info("Discovering Vue.js views...", self.verbose)
@@ -601,6 +645,7 @@ class ProjectAnalyzer:
 
         log_info(f"Found {self.view_count} views", self.verbose)
 
+    @_analysis_step
     def discover_services(self):
         """Discover backend services."""
         log_info("Discovering services...", self.verbose)
@@ -635,6 +680,7 @@ class ProjectAnalyzer:
 
         log_info(f"Found {self.service_count} services", self.verbose)
 
+    @_analysis_step
     def extract_features(self):
         """Extract features from README.md."""
         log_info("Extracting features from README...", self.verbose)
@@ -939,6 +985,7 @@ class ProjectAnalyzer:
             else "NEEDS CLARIFICATION"
         )
 
+    @_analysis_step
     def discover_actors(self):
         """Discover actors from various sources in the codebase."""
         log_info("Discovering actors...", self.verbose)
@@ -957,6 +1004,7 @@ class ProjectAnalyzer:
 
         log_info(f"Found {self.actor_count} actors", self.verbose)
 
+    @_analysis_step
     def discover_system_boundaries(self):
         """Identify system and subsystem boundaries with enhanced detection."""
         log_info("Discovering system boundaries...", self.verbose)
@@ -999,6 +1047,7 @@ class ProjectAnalyzer:
 
         log_info(f"Found {self.system_boundary_count} system boundaries", self.verbose)
 
+    @_analysis_step
     def map_relationships(self):
         """Map relationships between actors and systems with enhanced relationship mapping."""
         log_info("Mapping relationships...", self.verbose)
@@ -1074,6 +1123,7 @@ class ProjectAnalyzer:
                 self.verbose,
             )
 
+    @_analysis_step
     def extract_use_cases(self):
         """Extract use cases from discovered patterns."""
         log_info("Extracting use cases...", self.verbose)
@@ -4,183 +4,79 @@ Command-line interface for reverse engineering specifications.
 """
 
 import argparse
+import functools
+import logging
 import os
+import stat
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from .analyzer import PLUGIN_ARCHITECTURE_AVAILABLE, ProjectAnalyzer
 from .config import ProjectConfig
-from .generators import (
-    ApiContractGenerator,
-    DataModelGenerator,
-    PlanGenerator,
-    SpecGenerator,
-    UseCaseMarkdownGenerator,
-)
 from .templates.template_loader import SUPPORTED_LANGUAGES
-from .utils import find_repo_root, log_section
+from .utils import find_repo_root, log_section, write_if_changed
 
 if PLUGIN_ARCHITECTURE_AVAILABLE:
-    from .detectors import TechDetector
-
-
-def interactive_mode():
-    """Run interactive mode to gather user inputs."""
-    print("""
-╔════════════════════════════════════════════════════════════════════════════╗
-║                   RE-cue - Reverse Engineering                             ║
-║                         Interactive Mode                                   ║
-╚════════════════════════════════════════════════════════════════════════════╝
-""")
-
-    print("Let's configure your reverse engineering session.\n")
-
-    # Ask for project path
-    print("📁 Project Path")
-    print("   Enter the path to the project you want to analyze.")
-    print("   Press Enter to use the current directory.")
-    path_input = input("   Path: ").strip()
-    project_path = path_input if path_input else None
-
-    # Validate path if provided
-    if project_path:
-        path_obj = Path(project_path).resolve()
-        if not path_obj.exists():
-            print(f"\n❌ Error: Path does not exist: {project_path}", file=sys.stderr)
-            sys.exit(1)
-        if not path_obj.is_dir():
-            print(f"\n❌ Error: Path is not a directory: {project_path}", file=sys.stderr)
-            sys.exit(1)
-
-    print()
-
-    # Ask what to generate
-    print("📝 What would you like to generate?")
-    print("   You can select multiple options (y/n for each)")
-    print()
-
-    generate_spec = input("   Generate specification (spec.md)? [Y/n]: ").strip().lower()
-    generate_spec = generate_spec != "n"
-
-    generate_plan = input("   Generate implementation plan (plan.md)? [Y/n]: ").strip().lower()
-    generate_plan = generate_plan != "n"
+    from .frameworks import TechDetector
 
-    generate_data_model = (
-        input("   Generate data model documentation (data-model.md)? [Y/n]: ").strip().lower()
-    )
-    generate_data_model = generate_data_model != "n"
-
-    generate_api_contract = (
-        input("   Generate API contract (api-spec.json)? [Y/n]: ").strip().lower()
-    )
-    generate_api_contract = generate_api_contract != "n"
 
-    generate_use_cases = (
-        input("   Generate use case analysis (use-cases.md)? [Y/n]: ").strip().lower()
-    )
-    generate_use_cases = generate_use_cases != "n"
+class _StderrHandler(logging.StreamHandler):
+    """Stream handler that writes to whatever sys.stderr is at emit time."""
 
-    generate_quality = (
-        input("   Generate code quality report (quality-report.md)? [Y/n]: ").strip().lower()
-    )
-    generate_quality = generate_quality != "n"
+    def __init__(self):
+        logging.Handler.__init__(self)
 
-    print()
+    @property
+    def stream(self):
+        return sys.stderr
 
-    # Check if at least one option selected
-    if not any(
-        [
-            generate_spec,
-            generate_plan,
-            generate_data_model,
-            generate_api_contract,
-            generate_use_cases,
-            generate_quality,
-        ]
-    ):
-        print("❌ Error: At least one generation option must be selected.", file=sys.stderr)
-        sys.exit(1)
 
-    # Ask for description if spec is selected
-    description = None
-    if generate_spec:
-        print("📄 Project Description")
-        print("   Describe the project intent (e.g., 'forecast sprint delivery')")
-        description = input("   Description: ").strip()
-        if not description:
-            print("\n❌ Error: Description is required for spec generation.", file=sys.stderr)
-            sys.exit(1)
-        print()
+# Verbose-only CLI diagnostics, written as plain lines to stderr. The level is
+# set from --verbose in main(), so messages are not even formatted otherwise.
+# They do not propagate: configure_logging() puts a timestamped handler on the
+# "reverse_engineer" logger, which would print every line a second time.
+_log = logging.getLogger("reverse_engineer.cli")
+_log.addHandler(_StderrHandler())
+_log.propagate = False
 
-    # Ask for output format
-    print("📋 Output Format")
-    format_input = input("   Choose format (markdown/json) [markdown]: ").strip().lower()
-    output_format = format_input if format_input in ["markdown", "json"] else "markdown"
-    print()
+_INTERACTIVE_HEADER = """
+╔════════════════════════════════════════════════════════════════════════════╗
+║                   RE-cue - Reverse Engineering                             ║
+║                         Interactive Mode                                   ║
+╚════════════════════════════════════════════════════════════════════════════╝
 
-    # Ask for verbose mode
-    verbose_input = input("🔍 Enable verbose mode for detailed progress? [y/N]: ").strip().lower()
-    verbose = verbose_input == "y"
-    print()
+"""
 
-    # Display summary and confirm
-    print("═══════════════════════════════════════════════════════════════════")
-    print("  Configuration Summary")
-    print("═══════════════════════════════════════════════════════════════════")
-    print()
-    print(f"📁 Project Path: {project_path or 'Current directory (auto-detect)'}")
-    print("📝 Generating:")
-    if generate_spec:
-        print("   ✓ Specification (spec.md)")
-    if generate_plan:
-        print("   ✓ Implementation Plan (plan.md)")
-    if generate_data_model:
-        print("   ✓ Data Model (data-model.md)")
-    if generate_api_contract:
-        print("   ✓ API Contract (api-spec.json)")
-    if generate_use_cases:
-        print("   ✓ Use Case Analysis (use-cases.md)")
-    if generate_quality:
-        print("   ✓ Code Quality Report (quality-report.md)")
-    if description:
-        print(f"📄 Description: {description}")
-    print(f"📋 Format: {output_format}")
-    print(f"🔍 Verbose: {'Yes' if verbose else 'No'}")
-    print()
-    print("═══════════════════════════════════════════════════════════════════")
-    print()
+_SEPARATOR = "═" * 70
+_SUMMARY_RULE = "═" * 67
 
-    confirm = input("Ready to proceed? [Y/n]: ").strip().lower()
-    if confirm == "n":
-        print("\n❌ Operation cancelled by user.")
-        sys.exit(0)
+_FRAMEWORKS_TEXT = """
+🔧 Supported Frameworks:
 
-    print()
+  java_spring      - Java Spring Boot applications
+  nodejs_express   - Node.js with Express framework
+  nodejs_nestjs    - Node.js with NestJS framework
+  python_django    - Python Django applications
+  python_flask     - Python Flask applications
+  python_fastapi   - Python FastAPI applications
+  dotnet           - .NET/ASP.NET applications
+  ruby_rails       - Ruby on Rails applications
 
-    # Return configuration as a namespace object similar to argparse
-    class Config:
-        pass
-
-    config = Config()
-    config.path = project_path
-    config.spec = generate_spec
-    config.plan = generate_plan
-    config.data_model = generate_data_model
-    config.api_contract = generate_api_contract
-    config.use_cases = generate_use_cases
-    config.quality = generate_quality
-    config.description = description
-    config.format = output_format
-    config.verbose = verbose
-    config.output = None  # Use default
-    config.template_dir = None  # Use default templates
+Use --framework <name> to force a specific analyzer.
+Use --detect to auto-detect the framework.
 
-    return config
+"""
 
+# Fixed argument choices, in the order they are listed in help and error output
+_DIAGRAM_TYPES = ("flowchart", "sequence", "component", "er", "architecture", "all")
+_FORMAT_CHOICES = ("markdown", "json")
+_PHASE_CHOICES = ("1", "2", "3", "4", "all")
+_NAMING_STYLES = ("business", "technical", "concise", "verbose", "user_centric")
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_LOG_FORMATS = ("text", "json")
 
-def print_help_banner():
-    """Print the help banner."""
-    print("""
+_HELP_BANNER = """
 ╔════════════════════════════════════════════════════════════════════════════╗
 ║                   RE-cue - Reverse Engineering                             ║
 ╚════════════════════════════════════════════════════════════════════════════╝
@@ -378,7 +274,348 @@ Examples:
     --jira-project PROJ --jira-user user@example.com
 
 Use --help for more options.
-    """)
+
+"""
+
+# The static banners, pre-encoded once for _write_static()
+_INTERACTIVE_HEADER_BYTES = _INTERACTIVE_HEADER.encode("utf-8")
+_FRAMEWORKS_TEXT_BYTES = _FRAMEWORKS_TEXT.encode("utf-8")
+_HELP_BANNER_BYTES = _HELP_BANNER.encode("utf-8")
+_SUMMARY_CLOSING = f"\n{_SUMMARY_RULE}\n"
+_SUMMARY_CLOSING_BYTES = _SUMMARY_CLOSING.encode("utf-8")
+
+
+def _validate_path_string(path_string):
+    """Check a path argument for obviously invalid input without touching the filesystem.
+
+    Args:
+        path_string: Raw path argument
+
+    Returns:
+        Error message describing the problem, or None if the string is usable
+    """
+    if not path_string:
+        return "Path is empty"
+    if "\0" in path_string:
+        return "Path contains a null byte"
+    return None
+
+
+def _write_static(text, encoded, stream=None):
+    """Write a static banner to stdout or another text stream.
+
+    When the stream is a UTF-8 text stream over a binary buffer, the
+    pre-encoded bytes are written directly so the codec does not re-encode
+    the text on every call; otherwise (e.g. a non-UTF-8 console or a
+    StringIO) the text is written normally.
+
+    Args:
+        text: Banner text
+        encoded: The same text encoded as UTF-8
+        stream: Text stream to write to (default: sys.stdout)
+    """
+    if stream is None:
+        stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    encoding = (getattr(stream, "encoding", None) or "").lower().replace("-", "")
+    if buffer is None or encoding != "utf8":
+        stream.write(text)
+        return
+    stream.flush()
+    buffer.write(encoded)
+
+
+# Resolved project directories, keyed by (cwd, raw path argument)
+_RESOLVED_PROJECT_PATHS: dict = {}
+
+
+def _resolve_project_path(project_path):
+    """Resolve and validate the project directory, exiting on error.
+
+    Without a path, the ``RECUE_REPO_ROOT`` environment variable is used if
+    set (letting wrapper scripts skip the upward directory walk); otherwise
+    the repository root is detected from the current directory. Existence
+    and directory checks share a single ``os.stat`` call, and results are
+    memoized so repeated lookups of the same argument within one process do
+    not touch the filesystem again.
+
+    Args:
+        project_path: Path argument from the command line, or None
+
+    Returns:
+        Resolved project directory
+    """
+    if not project_path:
+        project_path = os.environ.get("RECUE_REPO_ROOT") or None
+
+    key = (os.getcwd(), project_path)
+    repo_root = _RESOLVED_PROJECT_PATHS.get(key)
+    if repo_root is not None:
+        return repo_root
+
+    if project_path:
+        error = _validate_path_string(project_path)
+        if error:
+            print(f"Error: {error}: {project_path!r}", file=sys.stderr)
+            sys.exit(1)
+        repo_root = Path(project_path).resolve()
+        try:
+            mode = os.stat(repo_root).st_mode
+        except OSError:
+            print(f"Error: Specified path does not exist: {project_path}", file=sys.stderr)
+            sys.exit(1)
+        if not stat.S_ISDIR(mode):
+            print(f"Error: Specified path is not a directory: {project_path}", file=sys.stderr)
+            sys.exit(1)
+    else:
+        repo_root = find_repo_root(Path.cwd())
+        if not repo_root:
+            print("Error: Could not determine repository root.", file=sys.stderr)
+            print("Tip: Use --path to specify the project directory.", file=sys.stderr)
+            sys.exit(1)
+
+    _RESOLVED_PROJECT_PATHS[key] = repo_root
+    return repo_root
+
+
+def _resolve_output_dir(args, repo_root, create=True):
+    """Return the directory for generated documents, creating it if needed.
+
+    ``--output-dir .`` selects the project root; without ``--output-dir`` the
+    default is ``<project-root>/re-<project-name>``. The result is stored on
+    ``args._output_dir`` so later steps reuse it instead of resolving again.
+
+    Args:
+        args: Parsed command-line arguments
+        repo_root: Resolved project directory
+        create: Create the directory now; pass False when the caller
+            creates it just before writing
+
+    Returns:
+        Output directory path
+    """
+    output_dir = getattr(args, "_output_dir", None)
+    if output_dir is None:
+        if not args.output_dir:
+            output_dir = repo_root / f"re-{repo_root.name}"
+        elif args.output_dir == ".":
+            output_dir = repo_root
+        else:
+            output_dir = Path(args.output_dir).resolve()
+        args._output_dir = output_dir
+
+    if create:
+        output_dir.mkdir(parents=True, exist_ok=True)
+    return output_dir
+
+
+# Interactive prompts, in the order they are asked
+_BATCH_ANSWER_KEYS = (
+    "path",
+    "spec",
+    "plan",
+    "data_model",
+    "api_contract",
+    "use_cases",
+    "quality",
+    "description",
+    "format",
+    "verbose",
+    "confirm",
+)
+
+
+def _read_batch_answers(lines: list[str]) -> dict:
+    """Parse ``key: value`` answers for interactive mode from non-TTY input.
+
+    Keys match the interactive prompts (see ``_BATCH_ANSWER_KEYS``). Dashes in
+    keys are treated as underscores; other lines, including blank lines and
+    ``#`` comments, are ignored. Returns an empty dict when no line is a
+    ``key: value`` answer.
+    """
+    answers = {}
+    for line in lines:
+        key, sep, value = line.strip().partition(":")
+        key = key.strip().lower().replace("-", "_")
+        if sep and key in _BATCH_ANSWER_KEYS:
+            answers[key] = value.strip()
+    return answers
+
+
+def interactive_mode():
+    """Run interactive mode to gather user inputs.
+
+    When stdin is not a terminal, all answers are read in one pass, either
+    as ``key: value`` lines (see ``_read_batch_answers``) or, when there are
+    none, as one line per prompt in the order asked. Unanswered prompts take
+    the same defaults as pressing Enter.
+    """
+    answers = None
+    positional = None
+    if not sys.stdin.isatty():
+        lines = sys.stdin.read().splitlines()
+        answers = _read_batch_answers(lines) or None
+        if answers is None:
+            # No key: value lines, so answer the prompts in order
+            positional = iter(lines)
+
+    def ask(key, prompt):
+        if answers is not None:
+            return answers.get(key, "")
+        if positional is not None:
+            return next(positional, "")
+        return input(prompt)
+
+    _write_static(_INTERACTIVE_HEADER, _INTERACTIVE_HEADER_BYTES)
+
+    print("Let's configure your reverse engineering session.\n")
+
+    # Ask for project path
+    print("📁 Project Path")
+    print("   Enter the path to the project you want to analyze.")
+    print("   Press Enter to use the current directory.")
+    path_input = ask("path", "   Path: ").strip()
+    project_path = path_input if path_input else None
+
+    # Validate path if provided
+    if project_path:
+        _resolve_project_path(project_path)
+
+    print()
+
+    # Ask what to generate
+    print("📝 What would you like to generate?")
+    print("   You can select multiple options (y/n for each)")
+    print()
+
+    generate_spec = ask("spec", "   Generate specification (spec.md)? [Y/n]: ").strip().lower()
+    generate_spec = generate_spec != "n"
+
+    generate_plan = (
+        ask("plan", "   Generate implementation plan (plan.md)? [Y/n]: ").strip().lower()
+    )
+    generate_plan = generate_plan != "n"
+
+    generate_data_model = (
+        ask("data_model", "   Generate data model documentation (data-model.md)? [Y/n]: ")
+        .strip()
+        .lower()
+    )
+    generate_data_model = generate_data_model != "n"
+
+    generate_api_contract = (
+        ask("api_contract", "   Generate API contract (api-spec.json)? [Y/n]: ").strip().lower()
+    )
+    generate_api_contract = generate_api_contract != "n"
+
+    generate_use_cases = (
+        ask("use_cases", "   Generate use case analysis (use-cases.md)? [Y/n]: ").strip().lower()
+    )
+    generate_use_cases = generate_use_cases != "n"
+
+    generate_quality = (
+        ask("quality", "   Generate code quality report (quality-report.md)? [Y/n]: ")
+        .strip()
+        .lower()
+    )
+    generate_quality = generate_quality != "n"
+
+    print()
+
+    # Check if at least one option selected
+    if not any(
+        [
+            generate_spec,
+            generate_plan,
+            generate_data_model,
+            generate_api_contract,
+            generate_use_cases,
+            generate_quality,
+        ]
+    ):
+        print("❌ Error: At least one generation option must be selected.", file=sys.stderr)
+        sys.exit(1)
+
+    # Ask for description if spec is selected
+    description = None
+    if generate_spec:
+        print("📄 Project Description")
+        print("   Describe the project intent (e.g., 'forecast sprint delivery')")
+        description = ask("description", "   Description: ").strip()
+        if not description:
+            print("\n❌ Error: Description is required for spec generation.", file=sys.stderr)
+            sys.exit(1)
+        print()
+
+    # Ask for output format
+    print("📋 Output Format")
+    format_input = ask("format", "   Choose format (markdown/json) [markdown]: ").strip().lower()
+    output_format = format_input if format_input in _FORMAT_CHOICES else "markdown"
+    print()
+
+    # Ask for verbose mode
+    verbose_input = (
+        ask("verbose", "🔍 Enable verbose mode for detailed progress? [y/N]: ").strip().lower()
+    )
+    verbose = verbose_input == "y"
+    print()
+
+    # Display summary and confirm
+    print(_SUMMARY_RULE)
+    print("  Configuration Summary")
+    print(_SUMMARY_RULE)
+    print()
+    print(f"📁 Project Path: {project_path or 'Current directory (auto-detect)'}")
+    print("📝 Generating:")
+    if generate_spec:
+        print("   ✓ Specification (spec.md)")
+    if generate_plan:
+        print("   ✓ Implementation Plan (plan.md)")
+    if generate_data_model:
+        print("   ✓ Data Model (data-model.md)")
+    if generate_api_contract:
+        print("   ✓ API Contract (api-spec.json)")
+    if generate_use_cases:
+        print("   ✓ Use Case Analysis (use-cases.md)")
+    if generate_quality:
+        print("   ✓ Code Quality Report (quality-report.md)")
+    if description:
+        print(f"📄 Description: {description}")
+    print(f"📋 Format: {output_format}")
+    print(f"🔍 Verbose: {'Yes' if verbose else 'No'}")
+    print()
+    print(_SUMMARY_RULE)
+    print()
+
+    confirm = ask("confirm", "Ready to proceed? [Y/n]: ").strip().lower()
+    if confirm == "n":
+        print("\n❌ Operation cancelled by user.")
+        sys.exit(0)
+
+    print()
+
+    # Start from the parser defaults so the result has the same attributes
+    # as a namespace produced by parse_args()
+    config = _get_parser().parse_args([])
+    vars(config).update(
+        path=project_path,
+        spec=generate_spec,
+        plan=generate_plan,
+        data_model=generate_data_model,
+        api_contract=generate_api_contract,
+        use_cases=generate_use_cases,
+        quality=generate_quality,
+        description=description,
+        format=output_format,
+        verbose=verbose,
+    )
+
+    return config
+
+
+def print_help_banner():
+    """Print the help banner."""
+    _write_static(_HELP_BANNER, _HELP_BANNER_BYTES)
 
 
 def create_parser():
@@ -533,7 +770,7 @@ The script will:
     viz_group.add_argument(
         "--diagram-type",
         type=str,
-        choices=["flowchart", "sequence", "component", "er", "architecture", "all"],
+        choices=_DIAGRAM_TYPES,
         default="all",
         help="Type of diagram to generate (default: all)",
     )
@@ -580,7 +817,7 @@ The script will:
     parser.add_argument(
         "-f",
         "--format",
-        choices=["markdown", "json"],
+        choices=_FORMAT_CHOICES,
         default="markdown",
         help="Output format: markdown or json (default: markdown)",
     )
@@ -595,7 +832,7 @@ The script will:
     parser.add_argument(
         "--phase",
         type=str,
-        choices=["1", "2", "3", "4", "all"],
+        choices=_PHASE_CHOICES,
         help="Run specific phase: 1=structure, 2=actors, 3=boundaries, 4=use-cases, all=run all",
     )
 
@@ -604,7 +841,7 @@ The script will:
     naming_group.add_argument(
         "--naming-style",
         type=str,
-        choices=["business", "technical", "concise", "verbose", "user_centric"],
+        choices=_NAMING_STYLES,
         default="business",
         help="Style for use case naming (default: business)",
     )
@@ -648,7 +885,7 @@ The script will:
         "--max-workers",
         type=int,
         default=None,
-        help="Maximum number of worker processes (default: CPU count)",
+        help="Maximum number of worker processes (default: available CPUs, up to 16)",
     )
 
     # Cache management flags
@@ -797,9 +1034,7 @@ The script will:
         metavar="URL",
         help="Jira server URL (e.g., https://your-domain.atlassian.net)",
     )
-    jira_group.add_argument(
-        "--jira-user", type=str, metavar="USER", help="Jira username or email"
-    )
+    jira_group.add_argument("--jira-user", type=str, metavar="USER", help="Jira username or email")
     jira_group.add_argument(
         "--jira-token",
         type=str,
@@ -824,7 +1059,7 @@ The script will:
     logging_group.add_argument(
         "--log-level",
         type=str,
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        choices=_LOG_LEVELS,
         default="INFO",
         help="Set logging level (default: INFO)",
     )
@@ -837,7 +1072,7 @@ The script will:
     logging_group.add_argument(
         "--log-format",
         type=str,
-        choices=["text", "json"],
+        choices=_LOG_FORMATS,
         default="text",
         help="Log output format: text or json (default: text)",
     )
@@ -864,57 +1099,57 @@ The script will:
     return parser
 
 
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """Return the shared argument parser, building it on first use.
+
+    The parser holds no per-invocation state (parse results live on the
+    returned Namespace), so repeated in-process calls to main() can reuse it.
+    """
+    return create_parser()
+
+
+# Phases whose last recorded state should be one of these before running
+_PHASE_PREREQUISITES = {
+    "2": {"1"},
+    "3": {"1", "2"},
+    "4": {"1", "2", "3"},
+}
+
+
 def run_phased_analysis(args):
     """Run analysis in phases with separate documents."""
-    from .phase_manager import PhaseManager, run_phase_1, run_phase_2, run_phase_3, run_phase_4
+    from .workflow.phase_manager import (
+        PhaseManager,
+        run_phase_1,
+        run_phase_2,
+        run_phase_3,
+        run_phase_4,
+    )
 
     # Find repository root - check both positional and flag arguments
-    project_path = args.project_path or args.path
-    if project_path:
-        repo_root = Path(project_path).resolve()
-        if not repo_root.exists():
-            print(f"Error: Specified path does not exist: {project_path}", file=sys.stderr)
-            sys.exit(1)
-        if not repo_root.is_dir():
-            print(f"Error: Specified path is not a directory: {project_path}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        repo_root = find_repo_root(Path.cwd())
-        if not repo_root:
-            print("Error: Could not determine repository root.", file=sys.stderr)
-            print("Tip: Use --path to specify the project directory.", file=sys.stderr)
-            sys.exit(1)
+    repo_root = _resolve_project_path(args.project_path or args.path)
 
     # Setup output directory
-    print("\n=== DEBUG: Output Directory Setup ===", file=sys.stderr)
-    print(f"args.output_dir = {args.output_dir!r}", file=sys.stderr)
-    print(f"repo_root = {repo_root}", file=sys.stderr)
-
-    if args.output_dir:
-        # Use specified output directory
-        if args.output_dir == ".":
-            output_dir = repo_root
-            print("Using repo_root as output_dir (output_dir='.')", file=sys.stderr)
-        else:
-            output_dir = Path(args.output_dir).resolve()
-            print(f"Using resolved output_dir: {output_dir}", file=sys.stderr)
-    else:
-        # Default: save to re-<project_name> in project root
-        project_name = repo_root.name
-        output_dir = repo_root / f"re-{project_name}"
-        print(f"No --output-dir specified, using default: {output_dir}", file=sys.stderr)
-
-    print(f"Final output_dir = {output_dir}", file=sys.stderr)
-    print("=====================================\n", file=sys.stderr)
-
-    output_dir.mkdir(parents=True, exist_ok=True)
+    output_dir = _resolve_output_dir(args, repo_root)
+
+    _log.debug(
+        "\n=== Output Directory Setup ===\n"
+        "args.output_dir = %r\n"
+        "repo_root = %s\n"
+        "Final output_dir = %s\n"
+        "==============================\n",
+        args.output_dir,
+        repo_root,
+        output_dir,
+    )
 
     # Initialize phase manager
     phase_manager = PhaseManager(repo_root, output_dir)
 
     # Get naming style from args
-    naming_style = getattr(args, "naming_style", "business")
-    template_language = getattr(args, "template_language", "en")
+    naming_style = args.naming_style
+    template_language = args.template_language
 
     # Initialize analyzer
     log_section("RE-cue - Phased Reverse Engineering")
@@ -925,58 +1160,41 @@ def run_phased_analysis(args):
         verbose=args.verbose,
         enable_optimizations=args.parallel,
         enable_incremental=args.incremental,
-        max_workers=args.max_workers,
+        max_workers=args.max_workers or _default_max_workers(),
         naming_style=naming_style,
         language=template_language,
         _suppress_deprecation_warning=True,
     )
 
     # Determine which phase to run
+    phase_runners = {"1": run_phase_1, "2": run_phase_2, "3": run_phase_3, "4": run_phase_4}
     phase = args.phase
 
     if phase == "all":
         # Run all phases sequentially
-        run_phase_1(analyzer, phase_manager, args.verbose)
-        run_phase_2(analyzer, phase_manager, args.verbose)
-        run_phase_3(analyzer, phase_manager, args.verbose)
-        run_phase_4(analyzer, phase_manager, args.verbose)
-    elif phase == "1":
-        run_phase_1(analyzer, phase_manager, args.verbose)
-    elif phase == "2":
-        # Load previous state if exists
-        state = phase_manager.load_state()
-        if state and state.get("last_phase") != "1":
-            print("Warning: Phase 1 may not have been completed yet.", file=sys.stderr)
-        run_phase_2(analyzer, phase_manager, args.verbose)
-    elif phase == "3":
-        state = phase_manager.load_state()
-        if state and state.get("last_phase") not in ["1", "2"]:
-            print("Warning: Previous phases may not have been completed yet.", file=sys.stderr)
-        run_phase_3(analyzer, phase_manager, args.verbose)
-    elif phase == "4":
-        state = phase_manager.load_state()
-        if state and state.get("last_phase") not in ["1", "2", "3"]:
-            print("Warning: Previous phases may not have been completed yet.", file=sys.stderr)
-        run_phase_4(analyzer, phase_manager, args.verbose)
-
-    print("\n" + "═" * 70, file=sys.stderr)
-    print(f"📁 All documents saved to: {output_dir}", file=sys.stderr)
-    print("═" * 70 + "\n", file=sys.stderr)
+        for runner in phase_runners.values():
+            runner(analyzer, phase_manager, args.verbose)
+    else:
+        prerequisites = _PHASE_PREREQUISITES.get(phase)
+        if prerequisites:
+            # Load previous state if exists
+            state = phase_manager.load_state()
+            if state and state.get("last_phase") not in prerequisites:
+                if prerequisites == {"1"}:
+                    print("Warning: Phase 1 may not have been completed yet.", file=sys.stderr)
+                else:
+                    print(
+                        "Warning: Previous phases may not have been completed yet.",
+                        file=sys.stderr,
+                    )
+        phase_runners[phase](analyzer, phase_manager, args.verbose)
+
+    sys.stderr.write(f"\n{_SEPARATOR}\n📁 All documents saved to: {output_dir}\n{_SEPARATOR}\n\n")
 
 
 def list_frameworks():
     """List all supported frameworks."""
-    print("\n🔧 Supported Frameworks:\n")
-    print("  java_spring      - Java Spring Boot applications")
-    print("  nodejs_express   - Node.js with Express framework")
-    print("  nodejs_nestjs    - Node.js with NestJS framework")
-    print("  python_django    - Python Django applications")
-    print("  python_flask     - Python Flask applications")
-    print("  python_fastapi   - Python FastAPI applications")
-    print("  dotnet           - .NET/ASP.NET applications")
-    print("  ruby_rails       - Ruby on Rails applications")
-    print("\nUse --framework <name> to force a specific analyzer.")
-    print("Use --detect to auto-detect the framework.\n")
+    _write_static(_FRAMEWORKS_TEXT, _FRAMEWORKS_TEXT_BYTES)
 
 
 def detect_framework(repo_root, verbose=False):
@@ -991,11 +1209,12 @@ def detect_framework(repo_root, verbose=False):
     detector = TechDetector(repo_root)
     tech_stack = detector.detect()
 
-    print("\n🔍 Framework Detection Results:\n")
-    print(f"  Framework:  {tech_stack.framework_id}")
-    print(f"  Language:   {tech_stack.language}")
-    print(f"  Confidence: {tech_stack.confidence:.1%}")
-    print()
+    sys.stdout.write(
+        "\n🔍 Framework Detection Results:\n\n"
+        f"  Framework:  {tech_stack.framework_id}\n"
+        f"  Language:   {tech_stack.language}\n"
+        f"  Confidence: {tech_stack.confidence:.1%}\n\n"
+    )
 
 
 def merge_config_with_args(args, config: ProjectConfig):
@@ -1209,9 +1428,183 @@ def merge_config_with_args(args, config: ProjectConfig):
     return args
 
 
+def _available_cpu_count():
+    """Return the number of CPUs this process may run on.
+
+    Honors CPU affinity masks (e.g. taskset or container cpusets) where the
+    platform exposes them, unlike os.cpu_count().
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _default_max_workers():
+    """Return the analysis worker count used when --max-workers is not given.
+
+    File analysis is CPU-bound regex parsing run in worker processes, so more
+    workers than usable CPUs only adds contention. The cap matches the limit
+    the analyzer applies when choosing a worker count itself.
+    """
+    return min(_available_cpu_count(), 16)
+
+
+def _generate_documents(tasks, max_workers=None):
+    """Render independent documents concurrently and write each to its file.
+
+    Generators only read the completed analysis, so they can share the
+    analyzer across threads; file writes and template I/O overlap with
+    rendering of the other documents.
+
+    Args:
+        tasks: (output_file, render) pairs, where render() returns the content
+        max_workers: Maximum number of threads (default: min(8, available CPUs))
+    """
+    if not tasks:
+        return
+
+    def render_and_write(output_file, render):
+        write_if_changed(output_file, render())
+
+    workers = min(max_workers or min(8, _available_cpu_count()), len(tasks))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(render_and_write, path, render) for path, render in tasks]
+        for future in as_completed(futures):
+            future.result()
+
+
+# WizardConfig field -> CLI argument attribute. The project path is applied to
+# both path and project_path, since different code paths check either one.
+_WIZARD_ARG_MAP = (
+    ("project_path", "path"),
+    ("project_path", "project_path"),
+    ("framework", "framework"),
+    ("generate_spec", "spec"),
+    ("generate_plan", "plan"),
+    ("generate_data_model", "data_model"),
+    ("generate_api_contract", "api_contract"),
+    ("generate_use_cases", "use_cases"),
+    ("description", "description"),
+    ("output_format", "format"),
+    ("verbose", "verbose"),
+    ("phased", "phased"),
+    ("output_directory", "output"),
+    ("custom_template_dir", "template_dir"),
+)
+
+
+def _apply_wizard_config(args, wizard_config):
+    """Copy settings from a wizard run or saved profile onto the parsed arguments.
+
+    Settings left unset (None) in the wizard config keep their CLI values.
+
+    Args:
+        args: Parsed command-line arguments
+        wizard_config: WizardConfig from run_wizard() or load_profile()
+    """
+    settings = vars(wizard_config)
+    vars(args).update(
+        {arg: settings[field] for field, arg in _WIZARD_ARG_MAP if settings[field] is not None}
+    )
+    # The wizard or profile may have changed --verbose
+    _log.setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+
+
+def _handle_cache_stats(args):
+    """Display cache statistics for the project (--cache-stats)."""
+    repo_root = _resolve_project_path(args.project_path or args.path or ".")
+
+    from .optimized_analyzer import OptimizedAnalyzer
+
+    output_dir = repo_root / "specs" / "001-reverse"
+    analyzer = OptimizedAnalyzer(
+        repo_root=repo_root, output_dir=output_dir, enable_caching=True, verbose=True
+    )
+    analyzer.print_cache_stats()
+
+
+def _handle_cleanup_cache(args):
+    """Remove expired and invalid cache entries (--cleanup-cache)."""
+    repo_root = _resolve_project_path(args.project_path or args.path or ".")
+
+    from .optimized_analyzer import OptimizedAnalyzer
+
+    output_dir = repo_root / "specs" / "001-reverse"
+    analyzer = OptimizedAnalyzer(
+        repo_root=repo_root, output_dir=output_dir, enable_caching=True, verbose=True
+    )
+    removed = analyzer.cleanup_cache()
+    print(f"Cleaned up {removed} cache entries")
+
+
+def _handle_list_profiles(args):
+    """List saved configuration profiles (--list-profiles)."""
+    from .config_wizard import list_profiles
+
+    list_profiles()
+
+
+def _handle_delete_profile(args):
+    """Delete a saved configuration profile (--delete-profile)."""
+    from .config_wizard import delete_profile
+
+    delete_profile(args.delete_profile)
+
+
+def _handle_list_frameworks(args):
+    """List supported frameworks (--list-frameworks)."""
+    list_frameworks()
+
+
+def _handle_detect(args):
+    """Detect and display the project framework (--detect)."""
+    repo_root = _resolve_project_path(args.project_path or args.path or ".")
+    detect_framework(repo_root, verbose=args.verbose)
+
+
+def _handle_refine_use_cases(args):
+    """Interactively refine an existing use case file (--refine-use-cases)."""
+    from .interactive_editor import run_interactive_editor
+
+    error = _validate_path_string(args.refine_use_cases)
+    if error:
+        print(f"Error: {error}: {args.refine_use_cases!r}", file=sys.stderr)
+        sys.exit(1)
+    if not os.path.lexists(args.refine_use_cases):
+        print(f"Error: Use case file not found: {args.refine_use_cases}", file=sys.stderr)
+        sys.exit(1)
+    run_interactive_editor(Path(args.refine_use_cases).resolve())
+
+
+# Commands that run on their own and exit, checked in order. Cache and
+# profile management run before --wizard/--load-profile are applied, the
+# rest after any wizard or profile settings have been applied.
+_PRE_PROFILE_HANDLERS = (
+    ("cache_stats", _handle_cache_stats),
+    ("cleanup_cache", _handle_cleanup_cache),
+    ("list_profiles", _handle_list_profiles),
+    ("delete_profile", _handle_delete_profile),
+)
+_FAST_EXIT_HANDLERS = (
+    ("list_frameworks", _handle_list_frameworks),
+    ("detect", _handle_detect),
+    ("refine_use_cases", _handle_refine_use_cases),
+    ("phase", run_phased_analysis),
+)
+
+
+def _dispatch_fast_exit(args, handlers) -> bool:
+    """Run the first handler whose flag is set; return whether one ran."""
+    for flag, handler in handlers:
+        if getattr(args, flag):
+            handler(args)
+            return True
+    return False
+
+
 def main():
     """Main entry point for the CLI."""
-    parser = create_parser()
+    parser = _get_parser()
 
     # Parse args early to get logging configuration
     # We parse twice - once for logging setup, once for full processing
@@ -1222,16 +1615,16 @@ def main():
     from pathlib import Path as LogPath
 
     log_file = None
-    if hasattr(temp_args, "log_file") and temp_args.log_file:
+    if temp_args.log_file:
         log_file = LogPath(temp_args.log_file)
 
     configure_logging(
-        level=getattr(temp_args, "log_level", "INFO"),
+        level=temp_args.log_level,
         log_file=log_file,
-        format_type=getattr(temp_args, "log_format", "text"),
-        max_bytes=getattr(temp_args, "log_max_bytes", 10485760),
-        backup_count=getattr(temp_args, "log_backup_count", 5),
-        enable_console=not getattr(temp_args, "no_console_log", False),
+        format_type=temp_args.log_format,
+        max_bytes=temp_args.log_max_bytes,
+        backup_count=temp_args.log_backup_count,
+        enable_console=not temp_args.no_console_log,
     )
 
     # Check if .recue.yaml exists before entering interactive mode
@@ -1254,7 +1647,8 @@ def main():
         args = parser.parse_args()
 
     # Load configuration file if explicitly specified
-    if not config_exists and hasattr(args, "config") and args.config:
+    config_source = None
+    if not config_exists and args.config:
         # Explicit config file specified
         config_file = Path(args.config)
         if not config_file.exists():
@@ -1264,186 +1658,68 @@ def main():
             config = ProjectConfig.load(config_file)
             if config:
                 args = merge_config_with_args(args, config)
-                if args.verbose:
-                    print(f"✓ Loaded configuration from {config_file}", file=sys.stderr)
+                config_source = config_file
         except Exception as e:
             print(f"Error loading configuration file: {e}", file=sys.stderr)
             sys.exit(1)
     elif not config_exists:
         # Try to auto-discover .recue.yaml from current directory or project path
         search_path = Path.cwd()
-        if hasattr(args, "project_path") and args.project_path:
+        if args.project_path:
             search_path = Path(args.project_path).resolve()
-        elif hasattr(args, "path") and args.path:
+        elif args.path:
             search_path = Path(args.path).resolve()
 
         config = ProjectConfig.find_and_load(search_path)
         if config:
             args = merge_config_with_args(args, config)
-            if args.verbose:
-                print("✓ Loaded configuration from .recue.yaml", file=sys.stderr)
-
-    # Handle cache management commands (these need project path)
-    if hasattr(args, "cache_stats") and args.cache_stats:
-        project_path = args.project_path or args.path or "."
-        repo_root = Path(project_path).resolve()
-        if not repo_root.exists() or not repo_root.is_dir():
-            print(f"Error: Invalid project path: {project_path}", file=sys.stderr)
-            sys.exit(1)
-
-        from .optimized_analyzer import OptimizedAnalyzer
-
-        output_dir = repo_root / "specs" / "001-reverse"
-        analyzer = OptimizedAnalyzer(
-            repo_root=repo_root, output_dir=output_dir, enable_caching=True, verbose=True
-        )
-        analyzer.print_cache_stats()
-        return
-
-    if hasattr(args, "cleanup_cache") and args.cleanup_cache:
-        project_path = args.project_path or args.path or "."
-        repo_root = Path(project_path).resolve()
-        if not repo_root.exists() or not repo_root.is_dir():
-            print(f"Error: Invalid project path: {project_path}", file=sys.stderr)
-            sys.exit(1)
-
-        from .optimized_analyzer import OptimizedAnalyzer
-
-        output_dir = repo_root / "specs" / "001-reverse"
-        analyzer = OptimizedAnalyzer(
-            repo_root=repo_root, output_dir=output_dir, enable_caching=True, verbose=True
-        )
-        removed = analyzer.cleanup_cache()
-        print(f"Cleaned up {removed} cache entries")
-        return
-
-    # Handle configuration profile commands
-    if hasattr(args, "list_profiles") and args.list_profiles:
-        from .config_wizard import list_profiles
-
-        list_profiles()
-        return
+            config_source = ".recue.yaml"
 
-    if hasattr(args, "delete_profile") and args.delete_profile:
-        from .config_wizard import delete_profile
+    _log.setLevel(logging.DEBUG if args.verbose else logging.WARNING)
+    if config_source:
+        _log.debug("✓ Loaded configuration from %s", config_source)
 
-        delete_profile(args.delete_profile)
+    # Handle cache and profile management commands
+    if _dispatch_fast_exit(args, _PRE_PROFILE_HANDLERS):
         return
 
     # Handle --wizard flag
-    if hasattr(args, "wizard") and args.wizard:
+    if args.wizard:
         from .config_wizard import run_wizard
 
         wizard_config = run_wizard()
-        # Convert wizard config to args-like object
-        # Set both path and project_path for compatibility with different code paths
-        args.path = wizard_config.project_path
-        args.project_path = wizard_config.project_path  # Some functions check project_path
-        args.framework = wizard_config.framework
-        args.spec = wizard_config.generate_spec
-        args.plan = wizard_config.generate_plan
-        args.data_model = wizard_config.generate_data_model
-        args.api_contract = wizard_config.generate_api_contract
-        args.use_cases = wizard_config.generate_use_cases
-        args.description = wizard_config.description
-        args.format = wizard_config.output_format
-        args.verbose = wizard_config.verbose
-        args.phased = wizard_config.phased
-        args.output = wizard_config.output_directory
-        args.template_dir = wizard_config.custom_template_dir
-        # Continue with normal execution
+        _apply_wizard_config(args, wizard_config)
 
     # Handle --load-profile flag
-    if hasattr(args, "load_profile") and args.load_profile:
+    if args.load_profile:
         from .config_wizard import load_profile
 
         wizard_config = load_profile(args.load_profile)
         if not wizard_config:
             sys.exit(1)
-        # Convert wizard config to args-like object
-        # Set both path and project_path for compatibility with different code paths
-        args.path = wizard_config.project_path
-        args.project_path = wizard_config.project_path  # Some functions check project_path
-        args.framework = wizard_config.framework
-        args.spec = wizard_config.generate_spec
-        args.plan = wizard_config.generate_plan
-        args.data_model = wizard_config.generate_data_model
-        args.api_contract = wizard_config.generate_api_contract
-        args.use_cases = wizard_config.generate_use_cases
-        args.description = wizard_config.description
-        args.format = wizard_config.output_format
-        args.verbose = wizard_config.verbose
-        args.phased = wizard_config.phased
-        args.output = wizard_config.output_directory
-        args.template_dir = wizard_config.custom_template_dir
-        # Continue with normal execution
-
-    # Handle --list-frameworks
-    if hasattr(args, "list_frameworks") and args.list_frameworks:
-        list_frameworks()
-        return
-
-    # Handle --detect
-    if hasattr(args, "detect") and args.detect:
-        project_path = args.project_path or args.path or "."
-        repo_root = Path(project_path).resolve()
-        if not repo_root.exists() or not repo_root.is_dir():
-            print(f"Error: Invalid project path: {project_path}", file=sys.stderr)
-            sys.exit(1)
-        detect_framework(repo_root, verbose=args.verbose if hasattr(args, "verbose") else False)
-        return
-
-    # Handle interactive refinement mode
-    if hasattr(args, "refine_use_cases") and args.refine_use_cases:
-        from .interactive_editor import run_interactive_editor
-
-        use_case_file = Path(args.refine_use_cases)
-        if not use_case_file.exists():
-            print(f"Error: Use case file not found: {args.refine_use_cases}", file=sys.stderr)
-            sys.exit(1)
-        run_interactive_editor(use_case_file)
-        return
+        _apply_wizard_config(args, wizard_config)
 
-    # Handle phased execution
-    if hasattr(args, "phase") and args.phase:
-        run_phased_analysis(args)
+    # Handle commands that run on their own and exit
+    if _dispatch_fast_exit(args, _FAST_EXIT_HANDLERS):
         return
 
     # Handle Git-only commands early (--blame, --git-changes, --changelog)
-    git_changes_flag = getattr(args, "git_changes", False)
-    changelog_flag = getattr(args, "changelog", False)
-    blame_flag = getattr(args, "blame", None)
+    git_changes_flag = args.git_changes
+    changelog_flag = args.changelog
+    blame_flag = args.blame
 
     if git_changes_flag or changelog_flag or blame_flag:
         # Find repository root first
-        project_path = args.project_path or getattr(args, "path", None)
-        if project_path:
-            repo_root = Path(project_path).resolve()
-        else:
-            repo_root = find_repo_root(Path.cwd())
-
-        if not repo_root:
-            print("Error: Could not determine repository root.", file=sys.stderr)
-            sys.exit(1)
+        repo_root = _resolve_project_path(args.project_path or args.path)
 
         # Setup output directory
-        if hasattr(args, "output_dir") and args.output_dir:
-            if args.output_dir == ".":
-                output_dir = repo_root
-            else:
-                output_dir = Path(args.output_dir).resolve()
-        else:
-            project_name = repo_root.name
-            output_dir = repo_root / f"re-{project_name}"
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = _resolve_output_dir(args, repo_root)
 
         from .analysis.git import GitAnalyzer
         from .generation.git import GitChangelogDocGenerator, GitChangesGenerator
 
         try:
-            git_analyzer = GitAnalyzer(
-                repo_root, verbose=args.verbose if hasattr(args, "verbose") else False
-            )
+            git_analyzer = GitAnalyzer(repo_root, verbose=args.verbose)
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
             sys.exit(1)
@@ -1461,11 +1737,11 @@ def main():
 
         # Handle --git-changes
         if git_changes_flag:
-            from_ref = getattr(args, "git_from", None)
-            to_ref = getattr(args, "git_to", "HEAD")
-            output_format = getattr(args, "format", "markdown")
+            from_ref = args.git_from
+            to_ref = args.git_to
+            output_format = args.format
 
-            changes_gen = GitChangesGenerator(git_analyzer, verbose=getattr(args, "verbose", False))
+            changes_gen = GitChangesGenerator(git_analyzer, verbose=args.verbose)
             changes_content = changes_gen.generate(from_ref, to_ref, output_format=output_format)
 
             if output_format == "json":
@@ -1473,20 +1749,17 @@ def main():
             else:
                 changes_file = output_dir / "git-changes.md"
 
-            with open(changes_file, "w") as f:
-                f.write(changes_content)
+            write_if_changed(changes_file, changes_content)
 
             print(f"✅ Git change analysis generated: {changes_file}", file=sys.stderr)
 
         # Handle --changelog
         if changelog_flag:
-            from_ref = getattr(args, "git_from", None)
-            to_ref = getattr(args, "git_to", "HEAD")
-            output_format = getattr(args, "format", "markdown")
+            from_ref = args.git_from
+            to_ref = args.git_to
+            output_format = args.format
 
-            changelog_gen = GitChangelogDocGenerator(
-                git_analyzer, verbose=getattr(args, "verbose", False)
-            )
+            changelog_gen = GitChangelogDocGenerator(git_analyzer, verbose=args.verbose)
             changelog_content = changelog_gen.generate(
                 from_ref, to_ref, output_format=output_format
             )
@@ -1496,35 +1769,34 @@ def main():
             else:
                 changelog_file = output_dir / "changelog.md"
 
-            with open(changelog_file, "w") as f:
-                f.write(changelog_content)
+            write_if_changed(changelog_file, changelog_content)
 
             print(f"✅ Changelog generated: {changelog_file}", file=sys.stderr)
 
         # If only Git commands were requested, we're done
         if not any(
             [
-                getattr(args, "spec", False),
-                getattr(args, "plan", False),
-                getattr(args, "data_model", False),
-                getattr(args, "api_contract", False),
-                getattr(args, "use_cases", False),
-                getattr(args, "diagrams", False),
-                getattr(args, "integration_tests", False),
-                getattr(args, "journey", False),
-                getattr(args, "traceability", False),
+                args.spec,
+                args.plan,
+                args.data_model,
+                args.api_contract,
+                args.use_cases,
+                args.diagrams,
+                args.integration_tests,
+                args.journey,
+                args.traceability,
             ]
         ):
             return
 
     # Check if at least one generation flag is provided
-    diagrams_flag = getattr(args, "diagrams", False)
-    integration_tests_flag = getattr(args, "integration_tests", False)
-    journey_flag = getattr(args, "journey", False)
-    traceability_flag = getattr(args, "traceability", False)
-    git_changes_flag = getattr(args, "git_changes", False)
-    changelog_flag = getattr(args, "changelog", False)
-    quality_flag = getattr(args, "quality", False)
+    diagrams_flag = args.diagrams
+    integration_tests_flag = args.integration_tests
+    journey_flag = args.journey
+    traceability_flag = args.traceability
+    git_changes_flag = args.git_changes
+    changelog_flag = args.changelog
+    quality_flag = args.quality
     if not any(
         [
             args.spec,
@@ -1554,38 +1826,13 @@ def main():
         sys.exit(1)
 
     # Find repository root - check both positional and flag arguments
-    project_path = args.project_path or args.path
-    if project_path:
-        # Use specified path
-        repo_root = Path(project_path).resolve()
-        if not repo_root.exists():
-            print(f"Error: Specified path does not exist: {project_path}", file=sys.stderr)
-            sys.exit(1)
-        if not repo_root.is_dir():
-            print(f"Error: Specified path is not a directory: {project_path}", file=sys.stderr)
-            sys.exit(1)
-    else:
-        # Auto-detect from current directory
-        repo_root = find_repo_root(Path.cwd())
-        if not repo_root:
-            print("Error: Could not determine repository root.", file=sys.stderr)
-            print("Tip: Use --path to specify the project directory.", file=sys.stderr)
-            sys.exit(1)
-
-    # Get project directory name for output path
-    project_name = repo_root.name
+    repo_root = _resolve_project_path(args.project_path or args.path)
 
     # Set default output file - save to re-<project_name> directory
     # First check if --output-dir was specified
     if args.output_dir:
-        if args.output_dir == ".":
-            output_dir = repo_root
-            print(
-                f"Using repo_root as output_dir (--output-dir='.'): {output_dir}", file=sys.stderr
-            )
-        else:
-            output_dir = Path(args.output_dir).resolve()
-            print(f"Using specified output_dir: {output_dir}", file=sys.stderr)
+        output_dir = _resolve_output_dir(args, repo_root, create=False)
+        print(f"Using specified output_dir: {output_dir}", file=sys.stderr)
         output_path = output_dir / "spec.md"
     elif args.output:
         output_path = Path(args.output)
@@ -1604,17 +1851,15 @@ def main():
             # Assume it's a file path
             output_dir = output_path.parent
     else:
-        # Default: create re-<project_name> directory in project root
-        output_dir = repo_root / f"re-{project_name}"
+        # Default: re-<project_name> directory in project root
+        output_dir = _resolve_output_dir(args, repo_root, create=False)
         output_path = output_dir / "spec.md"
 
-    output_dir.mkdir(parents=True, exist_ok=True)
-
     # Initialize analyzer
     log_section("RE-cue - Reverse Engineering")
 
     # Handle --clear-cache flag
-    if hasattr(args, "clear_cache") and args.clear_cache:
+    if args.clear_cache:
         from .optimized_analyzer import OptimizedAnalyzer
 
         temp_analyzer = OptimizedAnalyzer(
@@ -1624,8 +1869,8 @@ def main():
         print("Cache cleared successfully", file=sys.stderr)
 
     # Get naming style from args
-    naming_style = getattr(args, "naming_style", "business")
-    template_language = getattr(args, "template_language", "en")
+    naming_style = args.naming_style
+    template_language = args.template_language
 
     # Note: Using _suppress_deprecation_warning since CLI is the official interface
     # and will be updated when framework-specific analyzers fully support all features
@@ -1634,148 +1879,139 @@ def main():
         verbose=args.verbose,
         enable_optimizations=args.parallel,
         enable_incremental=args.incremental,
-        enable_caching=args.cache if hasattr(args, "cache") else True,
-        max_workers=args.max_workers,
+        enable_caching=args.cache,
+        max_workers=args.max_workers or _default_max_workers(),
         naming_style=naming_style,
         language=template_language,
         _suppress_deprecation_warning=True,
     )
     analyzer.analyze()
 
+    # Created only once analysis has finished, so a failed or cancelled run
+    # does not leave an empty output directory behind
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Documents that only read the completed analysis are rendered
+    # concurrently; each task pairs an output file with a render callable.
+    framework_id = getattr(analyzer, "framework_id", None)
+    template_language = args.template_language
+    doc_tasks = []
+    status = []
+
     # Generate spec.md if requested
     if args.spec:
-        print("\n📝 Generating specification...", file=sys.stderr)
-        spec_gen = SpecGenerator(analyzer, args.format)
-        spec_content = spec_gen.generate(args.description)
+        from .generators import SpecGenerator
 
-        with open(output_path, "w") as f:
-            f.write(spec_content)
+        status.append("\n📝 Generating specification...")
+        doc_tasks.append(
+            (output_path, lambda: SpecGenerator(analyzer, args.format).generate(args.description))
+        )
 
     # Generate plan.md if requested
     if args.plan:
-        plan_file = output_path.parent / "plan.md"
-        print("\n📝 Generating implementation plan...", file=sys.stderr)
-        plan_gen = PlanGenerator(analyzer)
-        plan_content = plan_gen.generate()
+        from .generators import PlanGenerator
 
-        with open(plan_file, "w") as f:
-            f.write(plan_content)
+        status.append("\n📝 Generating implementation plan...")
+        doc_tasks.append(
+            (output_path.parent / "plan.md", lambda: PlanGenerator(analyzer).generate())
+        )
 
     # Generate data-model.md if requested
     if args.data_model:
-        data_model_file = output_path.parent / "data-model.md"
-        print("\n📝 Generating data model documentation...", file=sys.stderr)
-        data_model_gen = DataModelGenerator(analyzer)
-        data_model_content = data_model_gen.generate()
+        from .generators import DataModelGenerator
 
-        with open(data_model_file, "w") as f:
-            f.write(data_model_content)
+        status.append("\n📝 Generating data model documentation...")
+        doc_tasks.append(
+            (output_path.parent / "data-model.md", lambda: DataModelGenerator(analyzer).generate())
+        )
 
     # Generate API contract if requested
     if args.api_contract:
+        from .generators import ApiContractGenerator
+
         api_contract_file = output_path.parent / "contracts" / "api-spec.json"
         api_contract_file.parent.mkdir(parents=True, exist_ok=True)
-        print("\n📝 Generating API contract specification...", file=sys.stderr)
-        api_contract_gen = ApiContractGenerator(analyzer)
-        api_contract_content = api_contract_gen.generate()
-
-        with open(api_contract_file, "w") as f:
-            f.write(api_contract_content)
+        status.append("\n📝 Generating API contract specification...")
+        doc_tasks.append((api_contract_file, lambda: ApiContractGenerator(analyzer).generate()))
 
     # Generate use cases if requested (generates all 4 phase documents by default)
     if args.use_cases:
-        from .generators import ActorDocGenerator, BoundaryDocGenerator, StructureDocGenerator
+        from .generators import (
+            ActorDocGenerator,
+            BoundaryDocGenerator,
+            StructureDocGenerator,
+            UseCaseMarkdownGenerator,
+        )
 
-        # Phase 1: Structure
-        phase1_file = output_path.parent / "phase1-structure.md"
-        print("\n📝 Generating Phase 1: Project Structure...", file=sys.stderr)
-        framework_id = getattr(analyzer, "framework_id", None)
-        template_language = getattr(args, "template_language", "en")
-        phase1_gen = StructureDocGenerator(analyzer, framework_id, language=template_language)
-        phase1_content = phase1_gen.generate()
-        with open(phase1_file, "w") as f:
-            f.write(phase1_content)
-
-        # Phase 2: Actors
-        phase2_file = output_path.parent / "phase2-actors.md"
-        print("📝 Generating Phase 2: Actor Discovery...", file=sys.stderr)
-        phase2_gen = ActorDocGenerator(analyzer, framework_id, language=template_language)
-        phase2_content = phase2_gen.generate()
-        with open(phase2_file, "w") as f:
-            f.write(phase2_content)
-
-        # Phase 3: Boundaries
-        phase3_file = output_path.parent / "phase3-boundaries.md"
-        print("📝 Generating Phase 3: System Boundaries...", file=sys.stderr)
-        phase3_gen = BoundaryDocGenerator(analyzer, framework_id, language=template_language)
-        phase3_content = phase3_gen.generate()
-        with open(phase3_file, "w") as f:
-            f.write(phase3_content)
-
-        # Phase 4: Use Cases
-        phase4_file = output_path.parent / "phase4-use-cases.md"
-        print("📝 Generating Phase 4: Use Case Analysis...", file=sys.stderr)
-        use_case_gen = UseCaseMarkdownGenerator(analyzer, framework_id, language=template_language)
-        use_case_content = use_case_gen.generate()
-        with open(phase4_file, "w") as f:
-            f.write(use_case_content)
-
-        print("\n✅ All phase documents generated:", file=sys.stderr)
-        print(f"   - {phase1_file}", file=sys.stderr)
-        print(f"   - {phase2_file}", file=sys.stderr)
-        print(f"   - {phase3_file}", file=sys.stderr)
-        print(f"   - {phase4_file}", file=sys.stderr)
+        phase_files = [
+            output_path.parent / "phase1-structure.md",
+            output_path.parent / "phase2-actors.md",
+            output_path.parent / "phase3-boundaries.md",
+            output_path.parent / "phase4-use-cases.md",
+        ]
+        status.extend(
+            (
+                "\n📝 Generating Phase 1: Project Structure...",
+                "📝 Generating Phase 2: Actor Discovery...",
+                "📝 Generating Phase 3: System Boundaries...",
+                "📝 Generating Phase 4: Use Case Analysis...",
+            )
+        )
+        for phase_file, generator_class in zip(
+            phase_files,
+            (
+                StructureDocGenerator,
+                ActorDocGenerator,
+                BoundaryDocGenerator,
+                UseCaseMarkdownGenerator,
+            ),
+        ):
+            generator = generator_class(analyzer, framework_id, language=template_language)
+            doc_tasks.append((phase_file, generator.generate))
+
+    # Generate diagrams if requested
+    if args.diagrams:
+        from .generators import VisualizationGenerator
+
+        diagrams_file = output_path.parent / "diagrams.md"
+        status.append("\n📊 Generating visualization diagrams...")
+        doc_tasks.append(
+            (diagrams_file, lambda: VisualizationGenerator(analyzer).generate(args.diagram_type))
+        )
+
+    if status:
+        sys.stderr.write("\n".join(status) + "\n")
+        sys.stderr.flush()
+    _generate_documents(doc_tasks, args.max_workers)
+
+    status.clear()
+    if args.use_cases:
+        status.append("\n✅ All phase documents generated:")
+        status.extend(f"   - {phase_file}" for phase_file in phase_files)
+    if args.diagrams:
+        status.append(f"✅ Visualization diagrams generated: {diagrams_file}")
+    if status:
+        sys.stderr.write("\n".join(status) + "\n")
 
     # Generate 4+1 architecture document if requested
     if args.fourplusone:
         from .generators import FourPlusOneDocGenerator
 
-        # Ensure we have all the data needed (run full analysis if not already done)
-        if args.use_cases:
-            # Data already collected above
-            pass
-        else:
-            # Need to run full analysis
-            print("\n🔄 Running full analysis for 4+1 architecture document...", file=sys.stderr)
-            analyzer.discover_endpoints()
-            analyzer.discover_models()
-            analyzer.discover_views()
-            analyzer.discover_services()
-            analyzer.extract_features()
-            analyzer.discover_actors()
-            analyzer.discover_system_boundaries()
-            analyzer.map_relationships()
-            analyzer.extract_use_cases()
+        # Run any discovery step that analyze() did not reach
+        analyzer.ensure_full_analysis()
 
         fourplusone_file = output_path.parent / "fourplusone-architecture.md"
         print("\n📝 Generating 4+1 Architecture View document...", file=sys.stderr)
-        framework_id = getattr(analyzer, "framework_id", None)
-        template_language = getattr(args, "template_language", "en")
-        fourplusone_gen = FourPlusOneDocGenerator(analyzer, framework_id, language=template_language)
+        fourplusone_gen = FourPlusOneDocGenerator(
+            analyzer, framework_id, language=template_language
+        )
         fourplusone_content = fourplusone_gen.generate()
-        with open(fourplusone_file, "w") as f:
-            f.write(fourplusone_content)
+        write_if_changed(fourplusone_file, fourplusone_content)
 
         print(f"✅ 4+1 Architecture document generated: {fourplusone_file}", file=sys.stderr)
 
-    # Generate diagrams if requested
-    if getattr(args, "diagrams", False):
-        from .generators import VisualizationGenerator
-
-        diagrams_file = output_path.parent / "diagrams.md"
-        print("\n📊 Generating visualization diagrams...", file=sys.stderr)
-
-        diagram_type = getattr(args, "diagram_type", "all")
-        viz_gen = VisualizationGenerator(analyzer)
-        diagrams_content = viz_gen.generate(diagram_type)
-
-        with open(diagrams_file, "w") as f:
-            f.write(diagrams_content)
-
-        print(f"✅ Visualization diagrams generated: {diagrams_file}", file=sys.stderr)
-
     # Generate integration test guidance if requested
-    if getattr(args, "integration_tests", False):
+    if args.integration_tests:
         from .generators import IntegrationTestGenerator
 
         integration_tests_file = output_path.parent / "integration-tests.md"
@@ -1785,15 +2021,14 @@ def main():
         int_test_gen = IntegrationTestGenerator(analyzer, framework_id)
         integration_tests_content = int_test_gen.generate()
 
-        with open(integration_tests_file, "w") as f:
-            f.write(integration_tests_content)
+        write_if_changed(integration_tests_file, integration_tests_content)
 
         print(
             f"✅ Integration testing guidance generated: {integration_tests_file}", file=sys.stderr
         )
 
     # Generate traceability matrix if requested
-    if getattr(args, "traceability", False):
+    if args.traceability:
         from .generation import TraceabilityGenerator
 
         traceability_file = output_path.parent / "traceability.md"
@@ -1803,7 +2038,7 @@ def main():
         trace_gen = TraceabilityGenerator(analyzer, framework_id)
 
         # Check if impact analysis is requested
-        impact_file = getattr(args, "impact_file", None)
+        impact_file = args.impact_file
         if impact_file:
             print(f"   Analyzing impact of: {impact_file}", file=sys.stderr)
             impact_analysis = trace_gen.analyze_impact(impact_file)
@@ -1813,20 +2048,18 @@ def main():
         else:
             traceability_content = trace_gen.generate()
 
-        with open(traceability_file, "w") as f:
-            f.write(traceability_content)
+        write_if_changed(traceability_file, traceability_content)
 
         # Also generate JSON output for programmatic use
         traceability_json_file = output_path.parent / "traceability.json"
         traceability_json = trace_gen.generate(output_format="json")
-        with open(traceability_json_file, "w") as f:
-            f.write(traceability_json)
+        write_if_changed(traceability_json_file, traceability_json)
 
         print(f"✅ Traceability matrix generated: {traceability_file}", file=sys.stderr)
         print(f"✅ Traceability JSON generated: {traceability_json_file}", file=sys.stderr)
 
     # Generate user journey mapping if requested
-    if getattr(args, "journey", False):
+    if args.journey:
         from .generation import JourneyGenerator
 
         journey_file = output_path.parent / "journey-map.md"
@@ -1836,20 +2069,18 @@ def main():
         journey_gen = JourneyGenerator(analyzer, framework_id)
         journey_content = journey_gen.generate()
 
-        with open(journey_file, "w") as f:
-            f.write(journey_content)
+        write_if_changed(journey_file, journey_content)
 
         # Also generate JSON output for programmatic use
         journey_json_file = output_path.parent / "journey-map.json"
         journey_json = journey_gen.generate(output_format="json")
-        with open(journey_json_file, "w") as f:
-            f.write(journey_json)
+        write_if_changed(journey_json_file, journey_json)
 
         print(f"✅ User journey mapping generated: {journey_file}", file=sys.stderr)
         print(f"✅ Journey JSON generated: {journey_json_file}", file=sys.stderr)
 
     # Generate code quality report if requested
-    if getattr(args, "quality", False):
+    if args.quality:
         from .generators import QualityReportGenerator
 
         quality_file = output_path.parent / "quality-report.md"
@@ -1859,32 +2090,23 @@ def main():
         include_details = getattr(args, "quality_details", False)
         quality_content = quality_gen.generate(include_file_details=include_details)
 
-        with open(quality_file, "w") as f:
-            f.write(quality_content)
+        write_if_changed(quality_file, quality_content)
 
         print(f"✅ Code quality report generated: {quality_file}", file=sys.stderr)
 
     # Export to Confluence if requested
-    if getattr(args, "confluence", False):
+    if args.confluence:
         from .exporters import ConfluenceConfig, ConfluenceExporter
 
         print("\n☁️  Exporting to Confluence...", file=sys.stderr)
 
         # Get Confluence configuration from args or environment
-        confluence_url = getattr(args, "confluence_url", None) or os.environ.get("CONFLUENCE_URL")
-        confluence_user = getattr(args, "confluence_user", None) or os.environ.get(
-            "CONFLUENCE_USER"
-        )
-        confluence_token = getattr(args, "confluence_token", None) or os.environ.get(
-            "CONFLUENCE_API_TOKEN"
-        )
-        confluence_space = getattr(args, "confluence_space", None) or os.environ.get(
-            "CONFLUENCE_SPACE_KEY"
-        )
-        confluence_parent = getattr(args, "confluence_parent", None) or os.environ.get(
-            "CONFLUENCE_PARENT_ID"
-        )
-        confluence_prefix = getattr(args, "confluence_prefix", "")
+        confluence_url = args.confluence_url or os.environ.get("CONFLUENCE_URL")
+        confluence_user = args.confluence_user or os.environ.get("CONFLUENCE_USER")
+        confluence_token = args.confluence_token or os.environ.get("CONFLUENCE_API_TOKEN")
+        confluence_space = args.confluence_space or os.environ.get("CONFLUENCE_SPACE_KEY")
+        confluence_parent = args.confluence_parent or os.environ.get("CONFLUENCE_PARENT_ID")
+        confluence_prefix = args.confluence_prefix
 
         # Validate required Confluence configuration
         if not confluence_url:
@@ -1952,17 +2174,17 @@ def main():
                         output_path.parent / "phase4-use-cases.md",
                     ]
                 )
-            if getattr(args, "fourplusone", False):
+            if args.fourplusone:
                 files_to_export.append(output_path.parent / "fourplusone-architecture.md")
-            if getattr(args, "diagrams", False):
+            if args.diagrams:
                 files_to_export.append(output_path.parent / "diagrams.md")
-            if getattr(args, "integration_tests", False):
+            if args.integration_tests:
                 files_to_export.append(output_path.parent / "integration-tests.md")
-            if getattr(args, "traceability", False):
+            if args.traceability:
                 files_to_export.append(output_path.parent / "traceability.md")
-            if getattr(args, "journey", False):
+            if args.journey:
                 files_to_export.append(output_path.parent / "journey-map.md")
-            if getattr(args, "quality", False):
+            if args.quality:
                 files_to_export.append(output_path.parent / "quality-report.md")
 
             # Filter to only existing files
@@ -2005,13 +2227,13 @@ def main():
             sys.exit(1)
 
     # Export to HTML if requested
-    if getattr(args, "html", False):
+    if args.html:
         from .exporters import HTMLConfig, HTMLExporter
 
         print("\n📄 Exporting to HTML...", file=sys.stderr)
 
         # Determine HTML output directory
-        html_output = getattr(args, "html_output", None)
+        html_output = args.html_output
         if html_output:
             html_dir = Path(html_output).resolve()
         else:
@@ -2020,10 +2242,10 @@ def main():
         html_dir.mkdir(parents=True, exist_ok=True)
 
         # Create HTML configuration
-        html_title = getattr(args, "html_title", "RE-cue Documentation")
-        dark_mode = not getattr(args, "html_no_dark_mode", False)
-        search = not getattr(args, "html_no_search", False)
-        theme_color = getattr(args, "html_theme_color", "#2563eb")
+        html_title = args.html_title
+        dark_mode = not args.html_no_dark_mode
+        search = not args.html_no_search
+        theme_color = args.html_theme_color
 
         config = HTMLConfig(
             output_dir=html_dir,
@@ -2053,15 +2275,15 @@ def main():
                     output_path.parent / "phase4-use-cases.md",
                 ]
             )
-        if getattr(args, "fourplusone", False):
+        if args.fourplusone:
             files_to_export.append(output_path.parent / "fourplusone-architecture.md")
-        if getattr(args, "diagrams", False):
+        if args.diagrams:
             files_to_export.append(output_path.parent / "diagrams.md")
-        if getattr(args, "integration_tests", False):
+        if args.integration_tests:
             files_to_export.append(output_path.parent / "integration-tests.md")
-        if getattr(args, "traceability", False):
+        if args.traceability:
             files_to_export.append(output_path.parent / "traceability.md")
-        if getattr(args, "journey", False):
+        if args.journey:
             files_to_export.append(output_path.parent / "journey-map.md")
 
         # Filter to only existing files
@@ -2107,19 +2329,17 @@ def main():
                 traceback.print_exc()
 
     # Export to Jira if requested
-    if getattr(args, "jira", False):
+    if args.jira:
         from .exporters import JiraConfig, JiraExporter
 
         print("\n🎫 Exporting to Jira...", file=sys.stderr)
 
         # Get Jira configuration from args or environment
-        jira_url = getattr(args, "jira_url", None) or os.environ.get("JIRA_URL")
-        jira_user = getattr(args, "jira_user", None) or os.environ.get("JIRA_USER")
-        jira_token = getattr(args, "jira_token", None) or os.environ.get("JIRA_API_TOKEN")
-        jira_project = getattr(args, "jira_project", None) or os.environ.get(
-            "JIRA_PROJECT_KEY"
-        )
-        jira_issue_type = getattr(args, "jira_issue_type", "Story")
+        jira_url = args.jira_url or os.environ.get("JIRA_URL")
+        jira_user = args.jira_user or os.environ.get("JIRA_USER")
+        jira_token = args.jira_token or os.environ.get("JIRA_API_TOKEN")
+        jira_project = args.jira_project or os.environ.get("JIRA_PROJECT_KEY")
+        jira_issue_type = args.jira_issue_type
 
         # Validate required Jira configuration
         if not jira_url:
@@ -2223,67 +2443,50 @@ def main():
     log_section("Generation Complete")
     print()
 
+    # Each block of status lines goes out in a single write
+    output_dir = output_path.parent
+    saved = []
     if args.spec:
-        print(f"✅ Specification saved to: {output_path}", file=sys.stderr)
-
+        saved.append(f"✅ Specification saved to: {output_path}")
     if args.plan:
-        print(f"✅ Plan saved to: {output_path.parent / 'plan.md'}", file=sys.stderr)
-
+        saved.append(f"✅ Plan saved to: {output_dir / 'plan.md'}")
     if args.data_model:
-        print(f"✅ Data model saved to: {output_path.parent / 'data-model.md'}", file=sys.stderr)
-
+        saved.append(f"✅ Data model saved to: {output_dir / 'data-model.md'}")
     if args.api_contract:
-        print(
-            f"✅ API contract saved to: {output_path.parent / 'contracts' / 'api-spec.json'}",
-            file=sys.stderr,
-        )
-
-    if getattr(args, "diagrams", False):
-        print(f"✅ Diagrams saved to: {output_path.parent / 'diagrams.md'}", file=sys.stderr)
-
-    if getattr(args, "integration_tests", False):
-        print(
-            f"✅ Integration tests saved to: {output_path.parent / 'integration-tests.md'}",
-            file=sys.stderr,
-        )
-
-    if getattr(args, "traceability", False):
-        print(
-            f"✅ Traceability matrix saved to: {output_path.parent / 'traceability.md'}",
-            file=sys.stderr,
-        )
-        print(
-            f"✅ Traceability JSON saved to: {output_path.parent / 'traceability.json'}",
-            file=sys.stderr,
-        )
-
-    if getattr(args, "journey", False):
-        print(
-            f"✅ User journey mapping saved to: {output_path.parent / 'journey-map.md'}",
-            file=sys.stderr,
-        )
-        print(
-            f"✅ Journey JSON saved to: {output_path.parent / 'journey-map.json'}", file=sys.stderr
-        )
+        saved.append(f"✅ API contract saved to: {output_dir / 'contracts' / 'api-spec.json'}")
+    if args.diagrams:
+        saved.append(f"✅ Diagrams saved to: {output_dir / 'diagrams.md'}")
+    if args.integration_tests:
+        saved.append(f"✅ Integration tests saved to: {output_dir / 'integration-tests.md'}")
+    if args.traceability:
+        saved.append(f"✅ Traceability matrix saved to: {output_dir / 'traceability.md'}")
+        saved.append(f"✅ Traceability JSON saved to: {output_dir / 'traceability.json'}")
+    if args.journey:
+        saved.append(f"✅ User journey mapping saved to: {output_dir / 'journey-map.md'}")
+        saved.append(f"✅ Journey JSON saved to: {output_dir / 'journey-map.json'}")
 
     # Note: --use-cases output messages are shown immediately after generation
 
-    print("\n📊 Analysis Statistics:", file=sys.stderr)
-    print(f"   • API Endpoints: {analyzer.endpoint_count}", file=sys.stderr)
-    print(f"   • Data Models: {analyzer.model_count}", file=sys.stderr)
-    print(f"   • UI Views: {analyzer.view_count}", file=sys.stderr)
-    print(f"   • Backend Services: {analyzer.service_count}", file=sys.stderr)
-    print(f"   • Actors: {analyzer.actor_count}", file=sys.stderr)
-    print(f"   • Use Cases: {analyzer.use_case_count}", file=sys.stderr)
+    saved.extend(
+        (
+            "\n📊 Analysis Statistics:",
+            f"   • API Endpoints: {analyzer.endpoint_count}",
+            f"   • Data Models: {analyzer.model_count}",
+            f"   • UI Views: {analyzer.view_count}",
+            f"   • Backend Services: {analyzer.service_count}",
+            f"   • Actors: {analyzer.actor_count}",
+            f"   • Use Cases: {analyzer.use_case_count}",
+        )
+    )
+    sys.stderr.write("\n".join(saved) + "\n")
     print()
 
     if args.spec and args.format == "markdown":
-        print("📖 View the specification:", file=sys.stderr)
-        print(f"   cat {output_path}", file=sys.stderr)
-        print("   # or", file=sys.stderr)
-        print(f"   code {output_path}", file=sys.stderr)
-
-    print("\n═══════════════════════════════════════════════════════════════════", file=sys.stderr)
+        sys.stderr.write(
+            f"📖 View the specification:\n   cat {output_path}\n   # or\n   code {output_path}\n"
+        )
+    _write_static(_SUMMARY_CLOSING, _SUMMARY_CLOSING_BYTES, sys.stderr)
+    sys.stderr.flush()
 
 
 if __name__ == "__main__":
@@ -4,8 +4,6 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
 
 @dataclass
 class FrameworkInfo:
@@ -70,8 +68,12 @@ class FrameworkConfig:
                 f"Expected file: {config_file}"
             )
 
-        with open(config_file) as f:
-            data = yaml.safe_load(f)
+        # Imported here so PyYAML is only loaded once a framework config is needed
+        import yaml
+
+        # Use the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        data = yaml.load(config_file.read_bytes(), Loader=loader)
 
         # Parse framework info
         framework_data = data.get("framework", {})
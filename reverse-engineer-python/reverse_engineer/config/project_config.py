@@ -6,19 +6,117 @@ This module provides support for loading project-specific configuration from
 version-controlled configuration file.
 """
 
+import sys
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
-import yaml
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
+# Parsed configurations keyed by (path, mtime_ns, size). Editing the file
+# changes the key, so a stale entry is never returned.
+_CONFIG_CACHE: dict[tuple[str, int, int], Optional["ProjectConfig"]] = {}
 
-@dataclass
+# Config file found for each directory searched, including misses (None).
+# Every directory on the upward walk is recorded, so later searches from the
+# same tree stop at the first directory already seen.
+_FIND_CACHE: dict[str, Optional[Path]] = {}
+
+# (yaml section, yaml key, ProjectConfig field, cast) for every supported
+# setting. Top-level keys use a section of None.
+_SCHEMA: tuple[tuple[Optional[str], str, str, Callable[[Any], Any]], ...] = (
+    # Project settings
+    (None, "project_path", "project_path", str),
+    (None, "framework", "framework", str),
+    (None, "description", "description", str),
+    # Generation flags
+    ("generation", "spec", "generate_spec", bool),
+    ("generation", "plan", "generate_plan", bool),
+    ("generation", "data_model", "generate_data_model", bool),
+    ("generation", "api_contract", "generate_api_contract", bool),
+    ("generation", "use_cases", "generate_use_cases", bool),
+    ("generation", "fourplusone", "generate_fourplusone", bool),
+    ("generation", "integration_tests", "generate_integration_tests", bool),
+    ("generation", "traceability", "generate_traceability", bool),
+    ("generation", "diagrams", "generate_diagrams", bool),
+    ("generation", "journey", "generate_journey", bool),
+    ("generation", "git_changes", "generate_git_changes", bool),
+    ("generation", "changelog", "generate_changelog", bool),
+    # Output settings
+    ("output", "format", "output_format", str),
+    ("output", "dir", "output_dir", str),
+    ("output", "file", "output_file", str),
+    ("output", "template_dir", "template_dir", str),
+    ("output", "template_language", "template_language", str),
+    # Analysis settings
+    ("analysis", "verbose", "verbose", bool),
+    ("analysis", "parallel", "parallel", bool),
+    ("analysis", "incremental", "incremental", bool),
+    ("analysis", "cache", "cache", bool),
+    ("analysis", "max_workers", "max_workers", int),
+    # Use case naming settings
+    ("naming", "style", "naming_style", str),
+    ("naming", "alternatives", "naming_alternatives", bool),
+    # Git settings
+    ("git", "enabled", "git_mode", bool),
+    ("git", "from", "git_from", str),
+    ("git", "to", "git_to", str),
+    ("git", "staged", "git_staged", bool),
+    # Diagram settings
+    ("diagrams", "type", "diagram_type", str),
+    # Confluence export settings
+    ("confluence", "enabled", "confluence_export", bool),
+    ("confluence", "url", "confluence_url", str),
+    ("confluence", "user", "confluence_user", str),
+    ("confluence", "token", "confluence_token", str),
+    ("confluence", "space", "confluence_space", str),
+    ("confluence", "parent", "confluence_parent", str),
+    ("confluence", "prefix", "confluence_prefix", str),
+    # HTML export settings
+    ("html", "enabled", "html_export", bool),
+    ("html", "output", "html_output", str),
+    ("html", "title", "html_title", str),
+    ("html", "dark_mode", "html_dark_mode", bool),
+    ("html", "search", "html_search", bool),
+    ("html", "theme_color", "html_theme_color", str),
+    # Jira export settings
+    ("jira", "enabled", "jira_export", bool),
+    ("jira", "url", "jira_url", str),
+    ("jira", "user", "jira_user", str),
+    ("jira", "token", "jira_token", str),
+    ("jira", "project", "jira_project", str),
+    ("jira", "issue_type", "jira_issue_type", str),
+    # Phase settings
+    ("phases", "enabled", "phased", bool),
+    ("phases", "phase", "phase", str),
+    # Impact analysis
+    (None, "impact_file", "impact_file", str),
+    # Additional options
+    (None, "refine_use_cases_file", "refine_use_cases_file", str),
+    (None, "blame_file", "blame_file", str),
+)
+
+# Layout used by ProjectConfig.to_dict(): the schema without credentials,
+# grouped into runs of consecutive (yaml key, field) pairs per section
+_TO_DICT_LAYOUT = tuple(
+    (section, tuple((key, field_name) for _, key, field_name, _ in entries))
+    for section, entries in groupby(
+        (entry for entry in _SCHEMA if entry[2] not in ("confluence_token", "jira_token")),
+        key=itemgetter(0),
+    )
+)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ProjectConfig:
     """Project configuration loaded from .recue.yaml file.
 
     This class encapsulates all project-specific configuration settings
     that can be defined in a .recue.yaml file in the project root.
+    Instances are immutable, so loaded configs can be shared safely.
     """
 
     # Project settings
@@ -117,12 +215,45 @@ class ProjectConfig:
             yaml.YAMLError: If configuration file has invalid YAML syntax
             ValueError: If configuration has invalid values
         """
-        if not config_path.exists():
+        try:
+            st = config_path.stat()
+        except OSError:
             return None
 
+        cache_key = (str(config_path), st.st_mtime_ns, st.st_size)
+        if cache_key not in _CONFIG_CACHE:
+            # An empty file holds no settings, so the parser is skipped
+            _CONFIG_CACHE[cache_key] = cls._parse(config_path) if st.st_size else None
+        return _CONFIG_CACHE[cache_key]
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget all parsed configs and config file lookups.
+
+        Useful for tests and long-running processes that create or remove
+        .recue.yaml files in directories that were already searched.
+        """
+        _CONFIG_CACHE.clear()
+        _FIND_CACHE.clear()
+
+    @classmethod
+    def _parse(cls, config_path: Path) -> Optional["ProjectConfig"]:
+        """Parse a .recue.yaml file into a ProjectConfig.
+
+        Args:
+            config_path: Path to an existing .recue.yaml file
+
+        Returns:
+            ProjectConfig instance, or None if the file is empty
+        """
+        # Imported here so code paths without a config file never load PyYAML
+        import yaml
+
         try:
-            with open(config_path) as f:
-                data = yaml.safe_load(f)
+            # Hand the whole file to the parser at once; libyaml then scans
+            # the buffer directly instead of pulling chunks through read()
+            loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+            data = yaml.load(config_path.read_bytes(), Loader=loader)
 
             if data is None:
                 return None
@@ -133,154 +264,13 @@ class ProjectConfig:
 
             # Convert YAML keys to ProjectConfig fields
             config_data = {}
-
-            # Project settings
-            if "project_path" in data:
-                config_data["project_path"] = str(data["project_path"])
-            if "framework" in data:
-                config_data["framework"] = str(data["framework"])
-            if "description" in data:
-                config_data["description"] = str(data["description"])
-
-            # Generation flags - support both boolean and nested dict format
-            generation = data.get("generation", {})
-            if isinstance(generation, dict):
-                config_data["generate_spec"] = generation.get("spec", False)
-                config_data["generate_plan"] = generation.get("plan", False)
-                config_data["generate_data_model"] = generation.get("data_model", False)
-                config_data["generate_api_contract"] = generation.get("api_contract", False)
-                config_data["generate_use_cases"] = generation.get("use_cases", False)
-                config_data["generate_fourplusone"] = generation.get("fourplusone", False)
-                config_data["generate_integration_tests"] = generation.get(
-                    "integration_tests", False
-                )
-                config_data["generate_traceability"] = generation.get("traceability", False)
-                config_data["generate_diagrams"] = generation.get("diagrams", False)
-                config_data["generate_journey"] = generation.get("journey", False)
-                config_data["generate_git_changes"] = generation.get("git_changes", False)
-                config_data["generate_changelog"] = generation.get("changelog", False)
-
-            # Output settings
-            output = data.get("output", {})
-            if isinstance(output, dict):
-                if "format" in output:
-                    config_data["output_format"] = str(output["format"])
-                if "dir" in output:
-                    config_data["output_dir"] = str(output["dir"])
-                if "file" in output:
-                    config_data["output_file"] = str(output["file"])
-                if "template_dir" in output:
-                    config_data["template_dir"] = str(output["template_dir"])
-                if "template_language" in output:
-                    config_data["template_language"] = str(output["template_language"])
-
-            # Analysis settings
-            analysis = data.get("analysis", {})
-            if isinstance(analysis, dict):
-                if "verbose" in analysis:
-                    config_data["verbose"] = bool(analysis["verbose"])
-                if "parallel" in analysis:
-                    config_data["parallel"] = bool(analysis["parallel"])
-                if "incremental" in analysis:
-                    config_data["incremental"] = bool(analysis["incremental"])
-                if "cache" in analysis:
-                    config_data["cache"] = bool(analysis["cache"])
-                if "max_workers" in analysis:
-                    config_data["max_workers"] = int(analysis["max_workers"])
-
-            # Use case naming settings
-            naming = data.get("naming", {})
-            if isinstance(naming, dict):
-                if "style" in naming:
-                    config_data["naming_style"] = str(naming["style"])
-                if "alternatives" in naming:
-                    config_data["naming_alternatives"] = bool(naming["alternatives"])
-
-            # Git settings
-            git = data.get("git", {})
-            if isinstance(git, dict):
-                if "enabled" in git:
-                    config_data["git_mode"] = bool(git["enabled"])
-                if "from" in git:
-                    config_data["git_from"] = str(git["from"])
-                if "to" in git:
-                    config_data["git_to"] = str(git["to"])
-                if "staged" in git:
-                    config_data["git_staged"] = bool(git["staged"])
-
-            # Diagram settings
-            diagrams = data.get("diagrams", {})
-            if isinstance(diagrams, dict):
-                if "type" in diagrams:
-                    config_data["diagram_type"] = str(diagrams["type"])
-
-            # Confluence export settings
-            confluence = data.get("confluence", {})
-            if isinstance(confluence, dict):
-                if "enabled" in confluence:
-                    config_data["confluence_export"] = bool(confluence["enabled"])
-                if "url" in confluence:
-                    config_data["confluence_url"] = str(confluence["url"])
-                if "user" in confluence:
-                    config_data["confluence_user"] = str(confluence["user"])
-                if "token" in confluence:
-                    config_data["confluence_token"] = str(confluence["token"])
-                if "space" in confluence:
-                    config_data["confluence_space"] = str(confluence["space"])
-                if "parent" in confluence:
-                    config_data["confluence_parent"] = str(confluence["parent"])
-                if "prefix" in confluence:
-                    config_data["confluence_prefix"] = str(confluence["prefix"])
-
-            # HTML export settings
-            html = data.get("html", {})
-            if isinstance(html, dict):
-                if "enabled" in html:
-                    config_data["html_export"] = bool(html["enabled"])
-                if "output" in html:
-                    config_data["html_output"] = str(html["output"])
-                if "title" in html:
-                    config_data["html_title"] = str(html["title"])
-                if "dark_mode" in html:
-                    config_data["html_dark_mode"] = bool(html["dark_mode"])
-                if "search" in html:
-                    config_data["html_search"] = bool(html["search"])
-                if "theme_color" in html:
-                    config_data["html_theme_color"] = str(html["theme_color"])
-
-            # Jira export settings
-            jira = data.get("jira", {})
-            if isinstance(jira, dict):
-                if "enabled" in jira:
-                    config_data["jira_export"] = bool(jira["enabled"])
-                if "url" in jira:
-                    config_data["jira_url"] = str(jira["url"])
-                if "user" in jira:
-                    config_data["jira_user"] = str(jira["user"])
-                if "token" in jira:
-                    config_data["jira_token"] = str(jira["token"])
-                if "project" in jira:
-                    config_data["jira_project"] = str(jira["project"])
-                if "issue_type" in jira:
-                    config_data["jira_issue_type"] = str(jira["issue_type"])
-
-            # Phase settings
-            phases = data.get("phases", {})
-            if isinstance(phases, dict):
-                if "enabled" in phases:
-                    config_data["phased"] = bool(phases["enabled"])
-                if "phase" in phases:
-                    config_data["phase"] = str(phases["phase"])
-
-            # Impact analysis
-            if "impact_file" in data:
-                config_data["impact_file"] = str(data["impact_file"])
-
-            # Additional options
-            if "refine_use_cases_file" in data:
-                config_data["refine_use_cases_file"] = str(data["refine_use_cases_file"])
-            if "blame_file" in data:
-                config_data["blame_file"] = str(data["blame_file"])
+            for section, key, field_name, cast in _SCHEMA:
+                values = data if section is None else data.get(section, {})
+                if isinstance(values, dict) and key in values:
+                    value = values[key]
+                    # PyYAML usually yields the right type already, so the
+                    # cast only runs for values that need converting
+                    config_data[field_name] = value if type(value) is cast else cast(value)
 
             return cls(**config_data)
 
@@ -303,94 +293,54 @@ class ProjectConfig:
             ProjectConfig instance if found, None otherwise
         """
         current = start_path.resolve()
+        visited = []
 
-        # Walk up the directory tree
+        # Walk up the directory tree, stopping early at a directory whose
+        # result is already known from an earlier search
         while True:
-            config_file = current / ".recue.yaml"
-            if config_file.exists():
-                return cls.load(config_file)
-
-            # Also check for .recue.yml variant
-            config_file_yml = current / ".recue.yml"
-            if config_file_yml.exists():
-                return cls.load(config_file_yml)
+            key = str(current)
+            if key in _FIND_CACHE:
+                config_file = _FIND_CACHE[key]
+                break
+            visited.append(key)
 
-            # Stop at filesystem root
-            if current.parent == current:
+            config_file = cls._config_file_in(current)
+            # Stop when found or at filesystem root
+            if config_file is not None or current.parent == current:
                 break
 
             current = current.parent
 
+        # Every directory passed on the way up shares the same result
+        for key in visited:
+            _FIND_CACHE[key] = config_file
+
+        return cls.load(config_file) if config_file is not None else None
+
+    @staticmethod
+    def _config_file_in(directory: Path) -> Optional[Path]:
+        """Return the .recue.yaml or .recue.yml in directory, if any."""
+        config_file = directory / ".recue.yaml"
+        if config_file.exists():
+            return config_file
+
+        # Also check for .recue.yml variant
+        config_file_yml = directory / ".recue.yml"
+        if config_file_yml.exists():
+            return config_file_yml
+
         return None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert config to dictionary for debugging/serialization."""
-        return {
-            "project_path": self.project_path,
-            "framework": self.framework,
-            "description": self.description,
-            "generation": {
-                "spec": self.generate_spec,
-                "plan": self.generate_plan,
-                "data_model": self.generate_data_model,
-                "api_contract": self.generate_api_contract,
-                "use_cases": self.generate_use_cases,
-                "fourplusone": self.generate_fourplusone,
-                "integration_tests": self.generate_integration_tests,
-                "traceability": self.generate_traceability,
-                "diagrams": self.generate_diagrams,
-                "journey": self.generate_journey,
-                "git_changes": self.generate_git_changes,
-                "changelog": self.generate_changelog,
-            },
-            "output": {
-                "format": self.output_format,
-                "dir": self.output_dir,
-                "file": self.output_file,
-                "template_dir": self.template_dir,
-                "template_language": self.template_language,
-            },
-            "analysis": {
-                "verbose": self.verbose,
-                "parallel": self.parallel,
-                "incremental": self.incremental,
-                "cache": self.cache,
-                "max_workers": self.max_workers,
-            },
-            "naming": {
-                "style": self.naming_style,
-                "alternatives": self.naming_alternatives,
-            },
-            "git": {
-                "enabled": self.git_mode,
-                "from": self.git_from,
-                "to": self.git_to,
-                "staged": self.git_staged,
-            },
-            "diagrams": {
-                "type": self.diagram_type,
-            },
-            "confluence": {
-                "enabled": self.confluence_export,
-                "url": self.confluence_url,
-                "user": self.confluence_user,
-                "space": self.confluence_space,
-                "parent": self.confluence_parent,
-                "prefix": self.confluence_prefix,
-            },
-            "html": {
-                "enabled": self.html_export,
-                "output": self.html_output,
-                "title": self.html_title,
-                "dark_mode": self.html_dark_mode,
-                "search": self.html_search,
-                "theme_color": self.html_theme_color,
-            },
-            "phases": {
-                "enabled": self.phased,
-                "phase": self.phase,
-            },
-            "impact_file": self.impact_file,
-            "refine_use_cases_file": self.refine_use_cases_file,
-            "blame_file": self.blame_file,
-        }
+        """Convert config to dictionary for debugging/serialization.
+
+        The result mirrors the .recue.yaml layout. API tokens are left out.
+        """
+        result: dict[str, Any] = {}
+        for section, items in _TO_DICT_LAYOUT:
+            values = {key: getattr(self, field_name) for key, field_name in items}
+            if section is None:
+                result.update(values)
+            else:
+                result[section] = values
+        return result
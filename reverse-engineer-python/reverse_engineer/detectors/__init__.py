@@ -5,8 +5,30 @@ DEPRECATED: This module is maintained for backward compatibility only.
 New code should import from reverse_engineer.frameworks package directly.
 """
 
-# Re-export from new frameworks package
-from ..domain import TechStack
-from ..frameworks import TechDetector
+import warnings
 
 __all__ = ["TechDetector", "TechStack"]
+
+
+def __getattr__(name: str):
+    # Re-export from the new packages on first access (PEP 562), so importing
+    # this shim does not load reverse_engineer.frameworks up front
+    if name == "TechDetector":
+        from ..frameworks import TechDetector as value
+
+        package = "reverse_engineer.frameworks"
+    elif name == "TechStack":
+        from ..domain import TechStack as value
+
+        package = "reverse_engineer.domain"
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    warnings.warn(
+        f"reverse_engineer.detectors.{name} is deprecated. Import {name} from {package} instead.",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    # Cache on the module so the warning is only issued on first access
+    globals()[name] = value
+    return value
@@ -5,6 +5,7 @@ This package contains pure domain models with no dependencies on other
 reverse_engineer modules, following domain-driven design principles.
 """
 
+from .._lazy import lazy_exports
 from .analysis_result import AnalysisResult
 from .entities import (
     Actor,
@@ -18,52 +19,6 @@ from .entities import (
     UseCase,
     View,
 )
-from .git import (
-    BlameEntry,
-    BlameResult,
-    BranchInfo,
-    ChangedFile,
-    Changelog,
-    ChangelogEntry,
-    CommitInfo,
-    FileChangeType,
-    GitAnalysisResult,
-    TagInfo,
-)
-from .journey import (
-    Epic,
-    JourneyMap,
-    JourneyStage,
-    Touchpoint,
-    UserJourney,
-    UserStory,
-)
-from .tech_stack import TechStack
-from .test_scenario import (
-    ApiTestCase,
-    CoverageMapping,
-    IntegrationTestSuite,
-    TestData,
-    TestScenario,
-    TestStep,
-)
-from .traceability import (
-    CodeLink,
-    ImpactAnalysis,
-    ImpactedItem,
-    TestLink,
-    TraceabilityEntry,
-    TraceabilityMatrix,
-)
-from .transaction import (
-    NestedTransaction,
-    RollbackRule,
-    TransactionAnalysisResult,
-    TransactionBoundary,
-    TransactionIsolation,
-    TransactionPattern,
-    TransactionPropagation,
-)
 from .progress import (
     AnalysisProgress,
     AnalysisStage,
@@ -73,21 +28,70 @@ from .progress import (
     ProgressSummary,
     StageProgress,
 )
-from .use_case_model import EditableUseCase
-from .workflow import (
-    AsyncOperation,
-    EventListener,
-    SagaPattern,
-    SagaStep,
-    ScheduledTask,
-    ScheduleType,
-    StateMachine,
-    StateTransition,
-    WorkflowAnalysisResult,
-    WorkflowPattern,
-    WorkflowStep,
-    WorkflowType,
-)
+from .tech_stack import TechStack
+
+# Models used only by optional features, imported on first access (PEP 562)
+# so that the core analysis path does not pay for loading them.
+_LAZY_IMPORTS = {
+    # Git models
+    "BlameEntry": ".git",
+    "BlameResult": ".git",
+    "BranchInfo": ".git",
+    "ChangedFile": ".git",
+    "Changelog": ".git",
+    "ChangelogEntry": ".git",
+    "CommitInfo": ".git",
+    "FileChangeType": ".git",
+    "GitAnalysisResult": ".git",
+    "TagInfo": ".git",
+    # Journey models
+    "Epic": ".journey",
+    "JourneyMap": ".journey",
+    "JourneyStage": ".journey",
+    "Touchpoint": ".journey",
+    "UserJourney": ".journey",
+    "UserStory": ".journey",
+    # Test scenario models
+    "ApiTestCase": ".test_scenario",
+    "CoverageMapping": ".test_scenario",
+    "IntegrationTestSuite": ".test_scenario",
+    "TestData": ".test_scenario",
+    "TestScenario": ".test_scenario",
+    "TestStep": ".test_scenario",
+    # Traceability models
+    "CodeLink": ".traceability",
+    "ImpactAnalysis": ".traceability",
+    "ImpactedItem": ".traceability",
+    "TestLink": ".traceability",
+    "TraceabilityEntry": ".traceability",
+    "TraceabilityMatrix": ".traceability",
+    # Transaction models
+    "NestedTransaction": ".transaction",
+    "RollbackRule": ".transaction",
+    "TransactionAnalysisResult": ".transaction",
+    "TransactionBoundary": ".transaction",
+    "TransactionIsolation": ".transaction",
+    "TransactionPattern": ".transaction",
+    "TransactionPropagation": ".transaction",
+    # Use case models
+    "EditableUseCase": ".use_case_model",
+    # Workflow models
+    "AsyncOperation": ".workflow",
+    "EventListener": ".workflow",
+    "SagaPattern": ".workflow",
+    "SagaStep": ".workflow",
+    "ScheduledTask": ".workflow",
+    "ScheduleType": ".workflow",
+    "StateMachine": ".workflow",
+    "StateTransition": ".workflow",
+    "WorkflowAnalysisResult": ".workflow",
+    "WorkflowPattern": ".workflow",
+    "WorkflowStep": ".workflow",
+    "WorkflowType": ".workflow",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     # Core entities
@@ -5,12 +5,23 @@ These dataclasses represent the fundamental domain model and have no dependencie
 on other reverse_engineer modules.
 """
 
+import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
+# Analysis results can hold thousands of these entities, so they use slots
+# instead of a per-instance __dict__ where the interpreter supports it
+# (dataclass(slots=True) is only available from Python 3.10)
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+def _intern(value):
+    """Intern a string drawn from a small vocabulary; leave other values as is."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(**_SLOTS)
 class Endpoint:
     """Represents an API endpoint."""
 
@@ -19,12 +30,14 @@ class Endpoint:
     controller: str
     authenticated: bool = False
 
+    # Display glyph indexed by authenticated: public, then secured
+    _AUTH_GLYPHS = ("🌐", "🔒")
+
     def __str__(self):
-        auth = "🔒" if self.authenticated else "🌐"
-        return f"{auth} {self.method} {self.path}"
+        return f"{self._AUTH_GLYPHS[bool(self.authenticated)]} {self.method} {self.path}"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Model:
     """Represents a data model."""
 
@@ -33,7 +46,7 @@ class Model:
     file_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class View:
     """Represents a UI view."""
 
@@ -42,7 +55,7 @@ class View:
     file_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Service:
     """Represents a backend service."""
 
@@ -50,7 +63,7 @@ class Service:
     file_path: Optional[Path] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Actor:
     """Represents an actor in the system (user, external system, etc.)."""
 
@@ -59,8 +72,12 @@ class Actor:
     access_level: str  # public, authenticated, admin, api_integration
     identified_from: list[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.type = _intern(self.type)
+        self.access_level = _intern(self.access_level)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class SystemBoundary:
     """Represents a system or subsystem boundary."""
 
@@ -69,8 +86,11 @@ class SystemBoundary:
     interfaces: list[str] = field(default_factory=list)
     type: str = "subsystem"  # primary_system, subsystem, external_system
 
+    def __post_init__(self):
+        self.type = _intern(self.type)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class Relationship:
     """Represents a relationship between actors and systems or between systems."""
 
@@ -80,8 +100,12 @@ class Relationship:
     mechanism: str = ""  # REST API call, async_message, method_invocation, etc.
     identified_from: list[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.relationship_type = _intern(self.relationship_type)
+        self.mechanism = _intern(self.mechanism)
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class UseCase:
     """Represents a use case with complete scenario definition."""
 
@@ -95,8 +119,11 @@ class UseCase:
     extensions: list[str] = field(default_factory=list)
     identified_from: list[str] = field(default_factory=list)
 
+    def __post_init__(self):
+        self.primary_actor = _intern(self.primary_actor)
+
 
-@dataclass
+@dataclass(**_SLOTS)
 class FileQualityMetrics:
     """Quality metrics for a single file."""
 
@@ -108,7 +135,7 @@ class FileQualityMetrics:
     comment_ratio: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class CodeQualityMetrics:
     """Container for code quality metrics."""
 
@@ -5,9 +5,23 @@ This package provides exporters for publishing generated documentation
 to external platforms like Confluence, Jira, etc.
 """
 
-from .confluence import ConfluenceConfig, ConfluenceExporter
-from .html_exporter import HTMLConfig, HTMLExporter, export_to_html
-from .jira import JiraConfig, JiraExporter, JiraIssueResult
+from .._lazy import lazy_exports
+
+# Each exporter is imported on first access (PEP 562), so using one of them
+# does not load the others and their network dependencies.
+_LAZY_IMPORTS = {
+    "ConfluenceConfig": ".confluence",
+    "ConfluenceExporter": ".confluence",
+    "HTMLConfig": ".html_exporter",
+    "HTMLExporter": ".html_exporter",
+    "export_to_html": ".html_exporter",
+    "JiraConfig": ".jira",
+    "JiraExporter": ".jira",
+    "JiraIssueResult": ".jira",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "ConfluenceExporter",
@@ -9,6 +9,8 @@ This module provides functionality to:
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
@@ -16,6 +18,9 @@ from ..domain import UseCase
 
 logger = logging.getLogger(__name__)
 
+# Most issues Jira accepts in one bulk-create request
+_BULK_CREATE_LIMIT = 50
+
 
 @dataclass
 class JiraConfig:
@@ -45,6 +50,9 @@ class JiraConfig:
     verify_ssl: bool = True
     """Whether to verify SSL certificates"""
 
+    max_workers: int = 8
+    """Maximum number of issues created concurrently"""
+
 
 @dataclass
 class JiraIssueResult:
@@ -85,6 +93,8 @@ class JiraExporter:
 
         self.config = config
         self._client: Optional[Any] = None
+        # Guards client creation when issues are created from several threads
+        self._client_lock = threading.Lock()
         logger.info("JiraExporter initialized for server: %s", config.server)
 
     def _get_client(self) -> Any:
@@ -98,14 +108,16 @@ class JiraExporter:
             JIRAError: If connection fails
         """
         if self._client is None:
-            logger.info("Connecting to Jira server: %s", self.config.server)
-            options = {"server": self.config.server, "verify": self.config.verify_ssl}
+            with self._client_lock:
+                if self._client is None:
+                    logger.info("Connecting to Jira server: %s", self.config.server)
+                    options = {"server": self.config.server, "verify": self.config.verify_ssl}
 
-            self._client = self.JIRA(
-                options=options,
-                basic_auth=(self.config.username, self.config.api_token),
-            )
-            logger.info("Successfully connected to Jira")
+                    self._client = self.JIRA(
+                        options=options,
+                        basic_auth=(self.config.username, self.config.api_token),
+                    )
+                    logger.info("Successfully connected to Jira")
 
         return self._client
 
@@ -166,7 +178,7 @@ class JiraExporter:
         if use_case.main_scenario:
             lines.append("")
             lines.append("h3. Main Scenario")
-            for i, step in enumerate(use_case.main_scenario, 1):
+            for step in use_case.main_scenario:
                 lines.append(f"# {step}")
 
         # Extensions
@@ -186,6 +198,32 @@ class JiraExporter:
 
         return "\n".join(lines)
 
+    def _use_case_to_fields(self, use_case: UseCase) -> dict[str, Any]:
+        """
+        Build the Jira issue fields for a use case.
+
+        Args:
+            use_case: UseCase to convert
+
+        Returns:
+            Issue fields accepted by create_issue and create_issues
+        """
+        issue_dict: dict[str, Any] = {
+            "project": {"key": self.config.project_key},
+            "summary": use_case.name,
+            "description": self._use_case_to_description(use_case),
+            "issuetype": {"name": self.config.issue_type},
+        }
+
+        # Add labels
+        if self.config.labels:
+            issue_dict["labels"] = self.config.labels.copy()
+            # Add use case ID as a label (sanitized)
+            sanitized_id = use_case.id.replace(" ", "-").lower()
+            issue_dict["labels"].append(f"uc-{sanitized_id}")
+
+        return issue_dict
+
     def create_issue_from_use_case(self, use_case: UseCase) -> JiraIssueResult:
         """
         Create a Jira issue from a use case.
@@ -198,21 +236,7 @@ class JiraExporter:
         """
         try:
             client = self._get_client()
-
-            # Build issue fields
-            issue_dict = {
-                "project": {"key": self.config.project_key},
-                "summary": use_case.name,
-                "description": self._use_case_to_description(use_case),
-                "issuetype": {"name": self.config.issue_type},
-            }
-
-            # Add labels
-            if self.config.labels:
-                issue_dict["labels"] = self.config.labels.copy()
-                # Add use case ID as a label (sanitized)
-                sanitized_id = use_case.id.replace(" ", "-").lower()
-                issue_dict["labels"].append(f"uc-{sanitized_id}")
+            issue_dict = self._use_case_to_fields(use_case)
 
             logger.info("Creating Jira issue for use case: %s", use_case.name)
             issue = client.create_issue(fields=issue_dict)
@@ -251,16 +275,85 @@ class JiraExporter:
         """
         Export multiple use cases as Jira issues.
 
+        Each issue costs a round trip to the Jira server, so up to
+        config.max_workers issues are created concurrently.
+
         Args:
             use_cases: List of UseCases to export
 
         Returns:
-            List of JiraIssueResult objects
+            List of JiraIssueResult objects, in the order of use_cases
+        """
+        workers = min(self.config.max_workers, len(use_cases))
+        if workers <= 1:
+            return [self.create_issue_from_use_case(use_case) for use_case in use_cases]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.create_issue_from_use_case, use_cases))
+
+    def export_use_cases_bulk(self, use_cases: list[UseCase]) -> list[JiraIssueResult]:
         """
-        results = []
+        Export multiple use cases with Jira's bulk-create endpoint.
 
-        for use_case in use_cases:
-            result = self.create_issue_from_use_case(use_case)
-            results.append(result)
+        Issues are sent in batches of up to 50, the most Jira accepts per
+        request, so N use cases take ceil(N / 50) round trips instead of N.
+
+        Args:
+            use_cases: List of UseCases to export
+
+        Returns:
+            List of JiraIssueResult objects, in the order of use_cases
+        """
+        results: list[JiraIssueResult] = []
+
+        for start in range(0, len(use_cases), _BULK_CREATE_LIMIT):
+            batch = use_cases[start : start + _BULK_CREATE_LIMIT]
+            try:
+                client = self._get_client()
+                logger.info("Creating %d Jira issues in bulk", len(batch))
+                # prefetch=False skips re-reading every created issue
+                created = client.create_issues(
+                    field_list=[self._use_case_to_fields(use_case) for use_case in batch],
+                    prefetch=False,
+                )
+            except self.JIRAError as e:
+                error_msg = f"Jira API error: {e}"
+                logger.error("Failed to create %d issues in bulk: %s", len(batch), error_msg)
+                results.extend(self._failed_result(use_case, error_msg) for use_case in batch)
+                continue
+            except Exception as e:
+                error_msg = f"Unexpected error: {e}"
+                logger.error("Failed to create %d issues in bulk: %s", len(batch), error_msg)
+                results.extend(self._failed_result(use_case, error_msg) for use_case in batch)
+                continue
+
+            # create_issues reports one entry per input, in input order
+            for use_case, item in zip(batch, created):
+                issue = item.get("issue")
+                if item.get("status") == "Success" and issue is not None:
+                    logger.info("Successfully created issue: %s", issue.key)
+                    results.append(
+                        JiraIssueResult(
+                            success=True,
+                            issue_key=issue.key,
+                            issue_url=f"{self.config.server}/browse/{issue.key}",
+                            use_case_id=use_case.id,
+                            use_case_name=use_case.name,
+                        )
+                    )
+                else:
+                    error_msg = f"Jira API error: {item.get('error')}"
+                    logger.error("Failed to create issue for %s: %s", use_case.name, error_msg)
+                    results.append(self._failed_result(use_case, error_msg))
 
         return results
+
+    @staticmethod
+    def _failed_result(use_case: UseCase, error_message: str) -> JiraIssueResult:
+        """Build the result for a use case whose issue could not be created."""
+        return JiraIssueResult(
+            success=False,
+            use_case_id=use_case.id,
+            use_case_name=use_case.name,
+            error_message=error_message,
+        )
@@ -5,17 +5,26 @@ This package consolidates all framework-specific code including analyzers,
 detectors, and factory functions for creating framework-specific instances.
 """
 
+from .._lazy import lazy_exports
 from .base import BaseAnalyzer
 from .detector import TechDetector
-from .dotnet import DotNetAspNetCoreAnalyzer
 from .factory import create_analyzer
 
-# Import framework-specific analyzers for convenience
-from .java_spring import JavaSpringAnalyzer
-from .nodejs import NodeExpressAnalyzer
-from .php import LaravelAnalyzer
-from .python import DjangoAnalyzer, FastAPIAnalyzer, FlaskAnalyzer
-from .ruby import RubyRailsAnalyzer
+# Framework-specific analyzers, imported on first access (PEP 562) so that
+# analysing a project only loads the analyzer for its own framework.
+_LAZY_IMPORTS = {
+    "DjangoAnalyzer": ".python",
+    "DotNetAspNetCoreAnalyzer": ".dotnet",
+    "FastAPIAnalyzer": ".python",
+    "FlaskAnalyzer": ".python",
+    "JavaSpringAnalyzer": ".java_spring",
+    "LaravelAnalyzer": ".php",
+    "NodeExpressAnalyzer": ".nodejs",
+    "RubyRailsAnalyzer": ".ruby",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = [
     "BaseAnalyzer",
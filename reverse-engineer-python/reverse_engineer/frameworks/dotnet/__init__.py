@@ -1,5 +1,14 @@
 """.NET framework analyzers."""
 
-from .aspnetcore_analyzer import DotNetAspNetCoreAnalyzer
+from ..._lazy import lazy_exports
+
+# Analyzers are imported on first access (PEP 562), so importing the package
+# does not load the analyzer module until it is used.
+_LAZY_IMPORTS = {
+    "DotNetAspNetCoreAnalyzer": ".aspnetcore_analyzer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = ["DotNetAspNetCoreAnalyzer"]
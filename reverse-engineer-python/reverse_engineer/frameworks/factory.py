@@ -2,11 +2,44 @@
 Factory for creating framework-specific analyzers.
 """
 
+import importlib
 from pathlib import Path
 from typing import Optional
 
+from .base import BaseAnalyzer
 from .detector import TechDetector
 
+# Analyzer for each detected framework_id as (module, class name). Only the
+# module of the detected framework is imported.
+_REGISTRY: dict[str, tuple[str, str]] = {
+    "java_spring": (".java_spring.analyzer", "JavaSpringAnalyzer"),
+    "nodejs_express": (".nodejs.express_analyzer", "NodeExpressAnalyzer"),
+    "nodejs_nestjs": (".nodejs.express_analyzer", "NodeExpressAnalyzer"),
+    "python_django": (".python.django_analyzer", "DjangoAnalyzer"),
+    "python_flask": (".python.flask_analyzer", "FlaskAnalyzer"),
+    "python_fastapi": (".python.fastapi_analyzer", "FastAPIAnalyzer"),
+    "ruby_rails": (".ruby.rails_analyzer", "RubyRailsAnalyzer"),
+    "dotnet": (".dotnet.aspnetcore_analyzer", "DotNetAspNetCoreAnalyzer"),
+    "dotnet_aspnetcore": (".dotnet.aspnetcore_analyzer", "DotNetAspNetCoreAnalyzer"),
+    "php_laravel": (".php.laravel_analyzer", "LaravelAnalyzer"),
+    "go_gin": (".go.gin_analyzer", "GinAnalyzer"),
+    "go_echo": (".go.echo_analyzer", "EchoAnalyzer"),
+    "go_fiber": (".go.fiber_analyzer", "FiberAnalyzer"),
+}
+
+# Analyzer classes already imported, keyed by framework_id
+_ANALYZER_CLASSES: dict[str, type[BaseAnalyzer]] = {}
+
+
+def _analyzer_class(framework_id: str) -> Optional[type[BaseAnalyzer]]:
+    """Return the analyzer class for framework_id, or None if it has none."""
+    analyzer_class = _ANALYZER_CLASSES.get(framework_id)
+    if analyzer_class is None and framework_id in _REGISTRY:
+        module_name, class_name = _REGISTRY[framework_id]
+        analyzer_class = getattr(importlib.import_module(module_name, __package__), class_name)
+        _ANALYZER_CLASSES[framework_id] = analyzer_class
+    return analyzer_class
+
 
 def create_analyzer(
     repo_root: Path,
@@ -30,15 +63,6 @@ def create_analyzer(
         Framework-specific analyzer instance or ProjectAnalyzer
     """
     try:
-        # Import framework-specific analyzers
-        from .dotnet import DotNetAspNetCoreAnalyzer
-        from .go import EchoAnalyzer, FiberAnalyzer, GinAnalyzer
-        from .java_spring import JavaSpringAnalyzer
-        from .nodejs import NodeExpressAnalyzer
-        from .php import LaravelAnalyzer
-        from .python import DjangoAnalyzer, FastAPIAnalyzer, FlaskAnalyzer
-        from .ruby import RubyRailsAnalyzer
-
         # Detect technology stack
         tech_stack = TechDetector(repo_root, verbose).detect()
 
@@ -46,31 +70,11 @@ def create_analyzer(
             print(f"Detected framework: {tech_stack.name}")
 
         # Return appropriate analyzer based on framework
-        if tech_stack.framework_id == "java_spring":
-            return JavaSpringAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id in ["nodejs_express", "nodejs_nestjs"]:
-            return NodeExpressAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "python_django":
-            return DjangoAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "python_flask":
-            return FlaskAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "python_fastapi":
-            return FastAPIAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "ruby_rails":
-            return RubyRailsAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id in ["dotnet", "dotnet_aspnetcore"]:
-            return DotNetAspNetCoreAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "php_laravel":
-            return LaravelAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "go_gin":
-            return GinAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "go_echo":
-            return EchoAnalyzer(repo_root, verbose)
-        elif tech_stack.framework_id == "go_fiber":
-            return FiberAnalyzer(repo_root, verbose)
-        else:
-            if verbose:
-                print(f"Using legacy analyzer for {tech_stack.name}")
+        analyzer_class = _analyzer_class(tech_stack.framework_id)
+        if analyzer_class is not None:
+            return analyzer_class(repo_root, verbose)
+        if verbose:
+            print(f"Using legacy analyzer for {tech_stack.name}")
     except Exception as e:
         if verbose:
             print(f"Framework detection failed: {e}, using legacy analyzer")
@@ -7,8 +7,17 @@ Supports:
 - Fiber (github.com/gofiber/fiber)
 """
 
-from .echo_analyzer import EchoAnalyzer
-from .fiber_analyzer import FiberAnalyzer
-from .gin_analyzer import GinAnalyzer
+from ..._lazy import lazy_exports
+
+# Analyzers are imported on first access (PEP 562), so a project using one
+# Go framework does not load the other two.
+_LAZY_IMPORTS = {
+    "EchoAnalyzer": ".echo_analyzer",
+    "FiberAnalyzer": ".fiber_analyzer",
+    "GinAnalyzer": ".gin_analyzer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = ["GinAnalyzer", "EchoAnalyzer", "FiberAnalyzer"]
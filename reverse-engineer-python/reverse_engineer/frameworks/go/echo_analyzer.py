@@ -9,12 +9,45 @@ Analyzes Echo (github.com/labstack/echo) applications to extract:
 - System boundaries and actors
 """
 
+import os
 import re
 from pathlib import Path
+from typing import Optional
 
 from ...utils import log_info
 from ..base import Actor, BaseAnalyzer, Endpoint, Model, Service, SystemBoundary, UseCase
 
+# Route scanning; every line is tested, so the patterns are compiled once
+_ROUTE_CALL_PATTERN = re.compile(r"\.(?:GET|POST|PUT|DELETE|PATCH|Add)\s*\(")
+# e.GET("/path", handler), e.POST("/path", handler, middleware)
+_METHOD_ROUTE_PATTERN = re.compile(
+    r'(?:e|echo|app)\.(?:GET|POST|PUT|DELETE|PATCH)\s*\(\s*"([^"]+)"'
+)
+_METHOD_NAME_PATTERN = re.compile(r"\.(\w+)\s*\(")
+# e.Add("GET", "/path", handler)
+_ADD_ROUTE_PATTERN = re.compile(r'\.Add\s*\(\s*"(GET|POST|PUT|DELETE|PATCH)"\s*,\s*"([^"]+)"')
+
+# Auth keywords matched as the start of an identifier, e.g. authMiddleware
+_AUTH_PATTERN = re.compile(
+    r"\b(?:auth|jwt|token|bearer|protected|requireauth|verifytoken|checkauth)\w*\b",
+    re.IGNORECASE,
+)
+
+# type ModelName struct {
+_STRUCT_PATTERN = re.compile(r"type\s+(\w+)\s+struct\s*\{")
+# Braces that open or close a block inside a struct body
+_BRACE_PATTERN = re.compile(r"[{}]")
+# Field lines: identifiers followed by types
+_STRUCT_FIELD_PATTERN = re.compile(r"^\s*\w+\s+(?:\*)?(?:\[\])?(?:\w+\.)?(\w+)", re.MULTILINE)
+
+# Role definitions: consts, enums and string literals
+_ROLE_PATTERNS = (
+    re.compile(r"const\s+Role(\w+)", re.IGNORECASE),
+    re.compile(r'Role\s*=\s*"(\w+)"', re.IGNORECASE),
+    re.compile(r'"role"\s*:\s*"(\w+)"', re.IGNORECASE),
+    re.compile(r'roles?\[\].*?"(\w+)"', re.IGNORECASE),
+)
+
 
 class EchoAnalyzer(BaseAnalyzer):
     """Analyzer for Echo framework applications."""
@@ -24,19 +57,51 @@ class EchoAnalyzer(BaseAnalyzer):
     def __init__(self, repo_root: Path, verbose: bool = False):
         """Initialize the Echo analyzer."""
         super().__init__(repo_root, verbose)
+        self._go_files: Optional[list[Path]] = None
+        self._dir_order: dict[Path, int] = {}
 
     def _is_test_file(self, file_path: Path) -> bool:
         """Check if file is a test file."""
         return file_path.name.endswith("_test.go")
 
+    def _collect_go_files(self) -> list[Path]:
+        """Return the non-test Go files in the repository, walking it only once."""
+        if self._go_files is None:
+            self._go_files = []
+            for dirpath, _, filenames in os.walk(self.repo_root):
+                directory = Path(dirpath)
+                self._dir_order[directory] = len(self._dir_order)
+                self._go_files.extend(
+                    directory / filename
+                    for filename in filenames
+                    if filename.endswith(".go") and not filename.endswith("_test.go")
+                )
+        return self._go_files
+
+    def _go_files_in_dirs(self, dir_names: list[str]) -> list[Path]:
+        """Return Go files directly inside directories with the given names.
+
+        Matches ``rglob("**/<name>/*.go")``: files are grouped by name, in
+        the order given, and ordered within a group by where the walk reached
+        the directory's parent. The repository root itself never matches.
+        """
+        by_dir: dict[str, list[Path]] = {name: [] for name in dir_names}
+        for go_file in self._collect_go_files():
+            parent = go_file.parent
+            if parent.name in by_dir and parent != self.repo_root:
+                by_dir[parent.name].append(go_file)
+
+        matches: list[Path] = []
+        for name in dir_names:
+            matches.extend(sorted(by_dir[name], key=lambda f: self._dir_order[f.parent.parent]))
+        return matches
+
     def discover_endpoints(self) -> list[Endpoint]:
         """Discover Echo route endpoints."""
         log_info("Discovering Echo routes...", self.verbose)
 
         # Find Go files that might contain routes
-        go_files = [f for f in self.repo_root.rglob("*.go") if not self._is_test_file(f)]
-
-        for go_file in go_files:
+        for go_file in self._collect_go_files():
             self._analyze_route_file(go_file)
 
         log_info(f"Found {self.endpoint_count} endpoints", self.verbose)
@@ -50,8 +115,9 @@ class EchoAnalyzer(BaseAnalyzer):
             log_info(f"  Error reading {file_path}: {e}", self.verbose)
             return
 
-        # Skip if doesn't use Echo
-        if "echo" not in content.lower():
+        # Skip if doesn't use Echo; checking both spellings avoids lowercasing
+        # a copy of every file (imports always contain "labstack/echo")
+        if "echo" not in content and "Echo" not in content:
             return
 
         log_info(f"  Processing: {file_path.name}", self.verbose)
@@ -60,34 +126,26 @@ class EchoAnalyzer(BaseAnalyzer):
         controller_name = file_path.stem.replace("_", " ").title().replace(" ", "")
 
         # Find Echo route definitions
-        # Patterns: e.GET("/path", handler), e.POST("/path", handler, middleware)
-        patterns = [
-            r'(?:e|echo|app)\.(?:GET|POST|PUT|DELETE|PATCH)\s*\(\s*"([^"]+)"',
-            r'(?:e|echo|app)\.Add\s*\(\s*"(GET|POST|PUT|DELETE|PATCH)"\s*,\s*"([^"]+)"',
-        ]
-
         lines = content.split("\n")
         for i, line in enumerate(lines):
             # Check for HTTP method patterns
-            method_match = re.search(r"\.(?:GET|POST|PUT|DELETE|PATCH|Add)\s*\(", line)
+            method_match = _ROUTE_CALL_PATTERN.search(line)
 
             if method_match:
                 method = None
                 path = None
 
                 # Try pattern 1: e.GET("/path", ...)
-                match = re.search(patterns[0], line)
+                match = _METHOD_ROUTE_PATTERN.search(line)
                 if match:
                     path = match.group(1)
-                    method_func = re.search(r"\.(\w+)\s*\(", line)
+                    method_func = _METHOD_NAME_PATTERN.search(line)
                     if method_func:
                         method = method_func.group(1).upper()
 
                 # Try pattern 2: e.Add("GET", "/path", ...)
                 if not match:
-                    match = re.search(
-                        r'\.Add\s*\(\s*"(GET|POST|PUT|DELETE|PATCH)"\s*,\s*"([^"]+)"', line
-                    )
+                    match = _ADD_ROUTE_PATTERN.search(line)
                     if match:
                         method = match.group(1).upper()
                         path = match.group(2)
@@ -109,32 +167,17 @@ class EchoAnalyzer(BaseAnalyzer):
         """Check for authentication middleware in nearby lines."""
         # Check the current line for inline middleware
         current = lines[current_line]
-        auth_keywords = [
-            "auth",
-            "jwt",
-            "token",
-            "bearer",
-            "protected",
-            "requireauth",
-            "verifytoken",
-            "checkauth",
-        ]
 
         # Look for auth keywords as function/variable names in the same line as the route
         # Pattern: e.POST("/path", authMiddleware, handler)
-        for keyword in auth_keywords:
-            # Match keyword as a separate identifier (not part of a larger word)
-            if re.search(rf"\b{keyword}\w*\b", current, re.IGNORECASE):
-                # Make sure it's after the route path and before the handler
-                # Split by commas to see if auth is between path and handler
-                parts = current.split(",")
-                if len(parts) >= 3:  # Has middleware
-                    # Check if auth keyword is in middle parts (middleware position)
-                    for i in range(1, len(parts) - 1):
-                        if re.search(rf"\b{keyword}\w*\b", parts[i], re.IGNORECASE):
-                            return True
-
-        return False
+        if not _AUTH_PATTERN.search(current):
+            return False
+
+        # Make sure it's after the route path and before the handler
+        # Split by commas to see if auth is between path and handler;
+        # with fewer than three parts there is no middleware position
+        parts = current.split(",")
+        return any(_AUTH_PATTERN.search(part) for part in parts[1:-1])
 
     def discover_models(self) -> list[Model]:
         """Discover data models from Go structs."""
@@ -142,16 +185,11 @@ class EchoAnalyzer(BaseAnalyzer):
 
         # Find Go files that might contain models
         model_patterns = ["models", "model", "entities", "entity", "domain"]
-        model_files: list[Path] = []
-
-        for pattern in model_patterns:
-            model_files.extend(
-                [f for f in self.repo_root.rglob(f"**/{pattern}/*.go") if not self._is_test_file(f)]
-            )
+        model_files = self._go_files_in_dirs(model_patterns)
 
         # Also look for struct definitions in any Go file
         if not model_files:
-            model_files = [f for f in self.repo_root.rglob("*.go") if not self._is_test_file(f)]
+            model_files = self._collect_go_files()
 
         for model_file in model_files:
             self._analyze_model_file(model_file)
@@ -168,11 +206,7 @@ class EchoAnalyzer(BaseAnalyzer):
             return
 
         # Find struct definitions
-        # Pattern: type ModelName struct {
-        struct_pattern = r"type\s+(\w+)\s+struct\s*\{"
-        structs = re.finditer(struct_pattern, content)
-
-        for struct_match in structs:
+        for struct_match in _STRUCT_PATTERN.finditer(content):
             model_name = struct_match.group(1)
 
             # Skip common non-model structs
@@ -194,17 +228,17 @@ class EchoAnalyzer(BaseAnalyzer):
             brace_count = 1
             field_count = 0
 
-            for i in range(start_pos, len(content)):
-                if content[i] == "{":
+            # Jump between braces instead of stepping through every character
+            for brace in _BRACE_PATTERN.finditer(content, start_pos):
+                if brace.group() == "{":
                     brace_count += 1
-                elif content[i] == "}":
+                else:
                     brace_count -= 1
                     if brace_count == 0:
                         # Extract struct body
-                        struct_body = content[start_pos:i]
+                        struct_body = content[start_pos : brace.start()]
                         # Count field lines (lines with identifiers followed by types)
-                        field_pattern = r"^\s*\w+\s+(?:\*)?(?:\[\])?(?:\w+\.)?(\w+)"
-                        field_count = len(re.findall(field_pattern, struct_body, re.MULTILINE))
+                        field_count = len(_STRUCT_FIELD_PATTERN.findall(struct_body))
                         break
 
             if field_count > 0:
@@ -217,14 +251,8 @@ class EchoAnalyzer(BaseAnalyzer):
 
         # Find service directories
         service_patterns = ["services", "service", "handlers", "handler"]
-        service_files: list[Path] = []
 
-        for pattern in service_patterns:
-            service_files.extend(
-                [f for f in self.repo_root.rglob(f"**/{pattern}/*.go") if not self._is_test_file(f)]
-            )
-
-        for service_file in service_files:
+        for service_file in self._go_files_in_dirs(service_patterns):
             service_name = service_file.stem.replace("_", " ").title().replace(" ", "")
             service = Service(name=service_name, file_path=service_file)
             self.services.append(service)
@@ -237,16 +265,13 @@ class EchoAnalyzer(BaseAnalyzer):
         log_info("Identifying actors...", self.verbose)
 
         # Look for auth/user related files
-        auth_files: list[Path] = []
-        auth_files.extend(
-            [f for f in self.repo_root.rglob("**/auth*.go") if not self._is_test_file(f)]
-        )
-        auth_files.extend(
-            [f for f in self.repo_root.rglob("**/user*.go") if not self._is_test_file(f)]
-        )
-        auth_files.extend(
-            [f for f in self.repo_root.rglob("**/role*.go") if not self._is_test_file(f)]
-        )
+        go_files = self._collect_go_files()
+        auth_files = [
+            go_file
+            for prefix in ("auth", "user", "role")
+            for go_file in go_files
+            if go_file.name.startswith(prefix)
+        ]
 
         roles_found = set()
 
@@ -255,16 +280,8 @@ class EchoAnalyzer(BaseAnalyzer):
                 content = auth_file.read_text()
 
                 # Look for role definitions (const, enums, string literals)
-                role_patterns = [
-                    r"const\s+Role(\w+)",
-                    r'Role\s*=\s*"(\w+)"',
-                    r'"role"\s*:\s*"(\w+)"',
-                    r'roles?\[\].*?"(\w+)"',
-                ]
-
-                for pattern in role_patterns:
-                    matches = re.findall(pattern, content, re.IGNORECASE)
-                    roles_found.update(matches)
+                for role_pattern in _ROLE_PATTERNS:
+                    roles_found.update(role_pattern.findall(content))
             except Exception as e:
                 log_info(f"  Error reading {auth_file}: {e}", self.verbose)
 
@@ -1,7 +1,16 @@
 """Python framework analyzers."""
 
-from .django_analyzer import DjangoAnalyzer
-from .fastapi_analyzer import FastAPIAnalyzer
-from .flask_analyzer import FlaskAnalyzer
+from ..._lazy import lazy_exports
+
+# Analyzers are imported on first access (PEP 562), so a project using one
+# Python framework does not load the other two.
+_LAZY_IMPORTS = {
+    "DjangoAnalyzer": ".django_analyzer",
+    "FastAPIAnalyzer": ".fastapi_analyzer",
+    "FlaskAnalyzer": ".flask_analyzer",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_IMPORTS)
+
 
 __all__ = ["DjangoAnalyzer", "FlaskAnalyzer", "FastAPIAnalyzer"]
@@ -155,7 +155,11 @@ class OptimizedAnalyzer:
 
         if use_parallel:
             # Use parallel processing
-            worker_count = self.max_workers or get_optimal_worker_count(len(files_to_process))
+            # Never start more worker processes than there are files
+            if self.max_workers:
+                worker_count = min(self.max_workers, len(files_to_process))
+            else:
+                worker_count = get_optimal_worker_count(len(files_to_process))
             if self.verbose:
                 log_info(
                     f"  Processing {len(files_to_process)} files using {worker_count} workers...",
@@ -3,6 +3,8 @@ Utility functions for the reverse engineering tool.
 """
 
 import logging
+import os
+import shutil
 import sys
 from pathlib import Path
 from typing import Optional
@@ -28,6 +30,65 @@ def find_repo_root(start_dir: Path) -> Optional[Path]:
     return None
 
 
+def atomic_write(path: Path, content: str):
+    """
+    Write a file as UTF-8 and move it into place atomically.
+
+    The content goes to a sibling temporary file that then replaces the
+    target, so an interrupted run never leaves a truncated file behind.
+    A symlinked target is written through the link, and an existing file
+    keeps its permissions.
+
+    Args:
+        path: Destination file
+        content: File text
+    """
+    path = Path(path)
+    if path.is_symlink():
+        path = path.resolve()
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(content.encode("utf-8"))
+        if path.exists():
+            shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_if_changed(path: Path, content: str) -> bool:
+    """
+    Write a file unless it already holds exactly the same content.
+
+    Leaving an identical file alone keeps its mtime, so file watchers and
+    CI jobs are not triggered by a re-run that produced nothing new.
+
+    Args:
+        path: Destination file
+        content: File text
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    data = content.encode("utf-8")
+    try:
+        # Compare sizes first so a changed file is rarely read back
+        unchanged = path.stat().st_size == len(data) and path.read_bytes() == data
+    except OSError:
+        unchanged = False
+
+    logger = logging.getLogger(__name__)
+    if unchanged:
+        logger.debug("Unchanged: %s", path)
+        return False
+
+    atomic_write(path, content)
+    logger.debug("Updated: %s", path)
+    return True
+
+
 def log_info(message: str, verbose: bool = True):
     """
     Log an informational message if verbose mode is enabled.
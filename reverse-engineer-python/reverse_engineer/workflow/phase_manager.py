@@ -138,7 +138,7 @@ def run_phase_1(analyzer, phase_manager: PhaseManager, verbose: bool = False):
     print(f"✓ Identified {analyzer.feature_count} features", file=sys.stderr)
 
     # Generate Phase 1 document
-    from .generators import StructureDocGenerator
+    from ..generators import StructureDocGenerator
 
     output_file = phase_manager.get_phase_output_file("1")
 
@@ -201,7 +201,7 @@ def run_phase_2(analyzer, phase_manager: PhaseManager, verbose: bool = False):
     print(f"✓ Found {analyzer.actor_count} actors\n", file=sys.stderr)
 
     # Generate Phase 2 document
-    from .generators import ActorDocGenerator
+    from ..generators import ActorDocGenerator
 
     output_file = phase_manager.get_phase_output_file("2")
 
@@ -249,7 +249,7 @@ def run_phase_3(analyzer, phase_manager: PhaseManager, verbose: bool = False):
     print(f"✓ Found {analyzer.system_boundary_count} boundaries\n", file=sys.stderr)
 
     # Generate Phase 3 document
-    from .generators import BoundaryDocGenerator
+    from ..generators import BoundaryDocGenerator
 
     output_file = phase_manager.get_phase_output_file("3")
 
@@ -312,7 +312,7 @@ def run_phase_4(analyzer, phase_manager: PhaseManager, verbose: bool = False):
     print(f"✓ Generated {analyzer.use_case_count} use cases\n", file=sys.stderr)
 
     # Generate Phase 4 document
-    from .generators import UseCaseMarkdownGenerator
+    from ..generators import UseCaseMarkdownGenerator
 
     output_file = phase_manager.get_phase_output_file("4")
 
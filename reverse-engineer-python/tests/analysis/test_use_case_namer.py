@@ -501,6 +501,18 @@ naming:
             self.assertTrue(namer.config.generate_alternatives)
             self.assertEqual(namer.config.num_alternatives, 4)
     
+    @unittest.skipUnless(HAS_YAML, "PyYAML not installed")
+    def test_load_utf8_yaml(self):
+        """Test that YAML files are decoded as UTF-8 regardless of locale."""
+        config_content = "naming:\n    business_terms:\n        order: Commande réservée\n"
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = Path(tmpdir) / "config.yaml"
+            config_path.write_bytes(config_content.encode("utf-8"))
+
+            namer = UseCaseNamer.from_config_file(config_path)
+
+            self.assertEqual(namer.config.business_terms["order"], "Commande réservée")
+
     def test_file_not_found_error(self):
         """Test error handling for missing config file."""
         with self.assertRaises(FileNotFoundError):
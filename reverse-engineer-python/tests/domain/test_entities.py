@@ -2,6 +2,8 @@
 Unit tests for domain entity models.
 """
 
+import pickle
+import sys
 import unittest
 from pathlib import Path
 
@@ -128,5 +130,38 @@ class TestEntities(unittest.TestCase):
         self.assertEqual(len(use_case.main_scenario), 2)
 
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots require Python 3.10")
+    def test_entities_use_slots(self):
+        """Test that entities carry no per-instance __dict__."""
+        endpoint = Endpoint(method="GET", path="/api/users", controller="UserController")
+        use_case = UseCase(id="UC-001", name="Create User", primary_actor="Admin")
+
+        self.assertFalse(hasattr(endpoint, "__dict__"))
+        self.assertFalse(hasattr(use_case, "__dict__"))
+        with self.assertRaises(AttributeError):
+            endpoint.unknown_field = True
+
+    def test_vocabulary_fields_interned(self):
+        """Test that enumerated string fields share one string object."""
+        # Build the strings at runtime so they are distinct objects
+        first = Relationship("A", "B", "".join(["service", "_call"]), "REST API call")
+        second = Relationship("C", "D", "".join(["service", "_call"]), "REST API call")
+        actor = Actor("Admin", "".join(["internal", "_user"]), "admin")
+
+        self.assertIs(first.relationship_type, second.relationship_type)
+        self.assertIs(actor.type, sys.intern("internal_user"))
+
+    def test_slotted_entities_pickle(self):
+        """Test that entities survive pickling for worker processes."""
+        actor = Actor(
+            name="Admin",
+            type="internal_user",
+            access_level="admin",
+            identified_from=["SecurityConfig"],
+        )
+
+        self.assertEqual(pickle.loads(pickle.dumps(actor)), actor)
+
+
 if __name__ == '__main__':
     unittest.main()
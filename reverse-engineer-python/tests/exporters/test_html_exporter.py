@@ -10,10 +10,15 @@ Tests cover:
 - Multiple file export
 """
 
+import os
+import sys
 import tempfile
 import unittest
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
+from reverse_engineer.exporters import html_exporter
 from reverse_engineer.exporters.html_exporter import (
     HTMLConfig,
     HTMLExporter,
@@ -64,6 +69,16 @@ class TestHTMLConfig(unittest.TestCase):
         self.assertEqual(config.css_dir, output_dir / "assets" / "css")
         self.assertEqual(config.js_dir, output_dir / "assets" / "js")
 
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots require Python 3.10")
+    def test_config_uses_slots(self):
+        """Test that configs and results carry no per-instance __dict__."""
+        config = HTMLConfig(output_dir=Path("/tmp/test-html"))
+        result = HTMLExportResult(success=True, title="Test Document")
+
+        self.assertFalse(hasattr(config, "__dict__"))
+        self.assertFalse(hasattr(result, "__dict__"))
+        self.assertFalse(hasattr(MarkdownToHTMLConverter(), "__dict__"))
+
 
 class TestHTMLExportResult(unittest.TestCase):
     """Test HTMLExportResult dataclass."""
@@ -115,6 +130,21 @@ class TestMarkdownToHTMLConverter(unittest.TestCase):
         self.assertIn('<h2 id="test-1">Test</h2>', html)
         self.assertIn('<h3 id="test-2">Test</h3>', html)
 
+    def test_duplicate_heading_ids_avoid_existing_ids(self):
+        """Test that numbered duplicate IDs never collide with real headings."""
+        html = self.converter.convert("# Test\n\n## Test 1\n\n## Test\n\n## Test 1")
+
+        self.assertIn('<h2 id="test-1">Test 1</h2>', html)
+        self.assertIn('<h2 id="test-2">Test</h2>', html)
+        self.assertIn('<h2 id="test-1-1">Test 1</h2>', html)
+
+    def test_heading_id_normalization(self):
+        """Test that heading IDs drop punctuation and collapse separators."""
+        html = self.converter.convert("## Hello,   World -- again!\n\n## Ünïcode – Déjà vu 2")
+
+        self.assertIn('id="hello-world-again"', html)
+        self.assertIn('id="ünïcode-déjà-vu-2"', html)
+
     def test_extract_title(self):
         """Test extracting title from markdown."""
         markdown = "# My Document\n\nSome content"
@@ -137,6 +167,21 @@ class TestMarkdownToHTMLConverter(unittest.TestCase):
         self.assertIn("<strong><em>bold italic</em></strong>", html)
         self.assertIn("<code>code</code>", html)
 
+    def test_convert_nested_emphasis(self):
+        """Test emphasis nested inside other formatting."""
+        html = self.converter.convert("**bold *it* bold** and ~~__gone__~~")
+
+        self.assertIn("<strong>bold <em>it</em> bold</strong>", html)
+        self.assertIn("<del><strong>gone</strong></del>", html)
+
+    def test_inline_code_content_is_literal(self):
+        """Test that emphasis markers inside inline code are not converted."""
+        html = self.converter.convert("Edit `__init__.py` or `a*b*c`, **see `x` here**")
+
+        self.assertIn("<code>__init__.py</code>", html)
+        self.assertIn("<code>a*b*c</code>", html)
+        self.assertIn("<strong>see <code>x</code> here</strong>", html)
+
     def test_convert_links(self):
         """Test link conversion."""
         markdown = "[link text](https://example.com)"
@@ -161,6 +206,28 @@ class TestMarkdownToHTMLConverter(unittest.TestCase):
         self.assertIn('class="language-python"', html)
         self.assertIn("def hello():", html)
 
+    def test_convert_many_code_blocks(self):
+        """Test that each placeholder is restored to its own code block."""
+        markdown = "\n\n".join(f"```\nblock {n}\n```" for n in range(12))
+        html = self.converter.convert(markdown)
+
+        self.assertNotIn("PLACEHOLDER", html)
+        self.assertIn("<pre><code>block 1</code></pre>", html)
+        self.assertIn("<pre><code>block 11</code></pre>", html)
+
+    def test_unclosed_code_fence_kept(self):
+        """Test that a fence without a closing fence stays literal text."""
+        html = self.converter.convert("```python\nprint(1)\n```\n\nAn unclosed ``` fence")
+
+        self.assertIn('<pre><code class="language-python">print(1)</code></pre>', html)
+        self.assertIn("An unclosed ``` fence", html)
+
+    def test_literal_placeholder_text_kept(self):
+        """Test that placeholder-like text without a code block is kept."""
+        html = self.converter.convert("```\ncode\n```\n\nCODEBLOCK7PLACEHOLDER")
+
+        self.assertIn("CODEBLOCK7PLACEHOLDER", html)
+
     def test_convert_code_blocks_no_language(self):
         """Test code block without language specifier."""
         markdown = "```\nsome code\n```"
@@ -206,6 +273,16 @@ class TestMarkdownToHTMLConverter(unittest.TestCase):
         self.assertIn("<tbody>", html)
         self.assertIn("<td>Cell 1</td>", html)
 
+    def test_table_cells_escaped_once(self):
+        """Test that special characters in table cells are escaped exactly once."""
+        markdown = '| a <b> | b & "c" |\n|---|---|\n| x&y | <i> |'
+        html = self.converter.convert(markdown)
+
+        self.assertIn("<th>a &lt;b&gt;</th>", html)
+        self.assertIn("<th>b &amp; &quot;c&quot;</th>", html)
+        self.assertIn("<td>x&amp;y</td>", html)
+        self.assertIn("<td>&lt;i&gt;</td>", html)
+
     def test_convert_blockquotes(self):
         """Test blockquote conversion."""
         markdown = "> This is a quote\n> Multiple lines"
@@ -222,6 +299,25 @@ class TestMarkdownToHTMLConverter(unittest.TestCase):
 
         self.assertIn("<hr />", html)
 
+    def test_block_stages_see_earlier_stage_output(self):
+        """Test that each block stage works on the lines the previous produced."""
+        markdown = "> - first\n> - second\n> ---\n\n---\n1. one\n2. two"
+        html = self.converter.convert(markdown)
+
+        self.assertIn(
+            "<blockquote>\n<ul>\n<li>first</li>\n<li>second</li>\n</ul>\n<hr />\n</blockquote>",
+            html,
+        )
+        self.assertIn("<hr />\n<ol>\n<li>one</li>\n<li>two</li>\n</ol>", html)
+
+    def test_indented_blockquote_without_other_blocks(self):
+        """Test a blockquote is found when the text has no other block markup."""
+        html = self.converter.convert("Intro with **bold** text\n  > quoted")
+
+        self.assertIn("<blockquote>", html)
+        self.assertNotIn("<table", html)
+        self.assertNotIn("<hr", html)
+
     def test_convert_paragraphs(self):
         """Test paragraph wrapping."""
         markdown = "This is a paragraph.\n\nThis is another paragraph."
@@ -248,6 +344,14 @@ class TestMarkdownToHTMLConverter(unittest.TestCase):
         self.assertEqual(toc[1]["level"], 2)
         self.assertEqual(toc[1]["id"], "section-1")
 
+    def test_extract_toc_strips_inline_markup(self):
+        """Test that TOC text drops tags from formatted headings."""
+        html = self.converter.convert("## **Bold** and `code`\n\n## Plain")
+        toc = self.converter.extract_toc(html)
+
+        self.assertEqual([item["text"] for item in toc], ["Bold and code", "Plain"])
+        self.assertEqual(toc[0]["level"], 2)
+
     def test_complex_markdown(self):
         """Test conversion of complex markdown document."""
         markdown = """
@@ -333,6 +437,21 @@ class TestHTMLExporter(unittest.TestCase):
         self.assertIn("Test Document", html_content)
         self.assertIn("This is a test", html_content)
 
+    def test_export_single_file_writes_linked_assets(self):
+        """Test that a single-file export writes the assets its page links to."""
+        md_file = self.temp_path / "test.md"
+        md_file.write_text("# Test Document")
+
+        config = HTMLConfig(output_dir=self.output_dir)
+        result = HTMLExporter(config).export_file(md_file)
+
+        html_content = result.file_path.read_text()
+        self.assertIn('<link rel="stylesheet" href="assets/css/styles.css">', html_content)
+        self.assertIn('<script src="assets/js/script.js"></script>', html_content)
+        self.assertNotIn("<style>", html_content)
+        self.assertTrue((config.css_dir / "styles.css").exists())
+        self.assertTrue((config.js_dir / "script.js").exists())
+
     def test_export_file_with_custom_title(self):
         """Test exporting file with custom title."""
         md_file = self.temp_path / "test.md"
@@ -375,6 +494,64 @@ class TestHTMLExporter(unittest.TestCase):
         for i in range(3):
             self.assertIn(f"doc{i}.html", index_content)
 
+    def test_export_multiple_files_in_parallel(self):
+        """Test that parallel export returns results in input order."""
+        files = []
+        for i in range(12):
+            md_file = self.temp_path / f"doc{i}.md"
+            md_file.write_text(f"# Document {i}\n\nContent for document {i}")
+            files.append(md_file)
+
+        config = HTMLConfig(output_dir=self.output_dir)
+        exporter = HTMLExporter(config)
+        results = exporter.export_multiple_files(files, max_workers=2)
+
+        self.assertEqual([r.title for r in results], [f"Document {i}" for i in range(12)])
+        self.assertTrue(all(r.success for r in results))
+        self.assertTrue((self.output_dir / "doc11.html").exists())
+
+    def test_pool_failure_falls_back_to_sequential_export(self):
+        """Test that a process pool that cannot start does not abort the export."""
+        files = []
+        for i in range(12):
+            md_file = self.temp_path / f"doc{i}.md"
+            md_file.write_text(f"# Document {i}")
+            files.append(md_file)
+
+        exporter = HTMLExporter(HTMLConfig(output_dir=self.output_dir))
+        with patch.object(
+            html_exporter, "ProcessPoolExecutor", side_effect=OSError("no /dev/shm")
+        ) as pool:
+            results = exporter.export_multiple_files(files, max_workers=2)
+
+        pool.assert_called_once()
+        self.assertEqual([r.title for r in results], [f"Document {i}" for i in range(12)])
+        self.assertTrue(all(r.success for r in results))
+        self.assertIn("doc11.html", (self.output_dir / "index.html").read_text())
+
+    def test_batch_pages_share_timestamp(self):
+        """Test that every page of a batch and the index carry one timestamp."""
+        files = []
+        for i in range(3):
+            md_file = self.temp_path / f"doc{i}.md"
+            md_file.write_text(f"# Document {i}")
+            files.append(md_file)
+
+        exporter = HTMLExporter(HTMLConfig(output_dir=self.output_dir))
+        clock = iter(datetime(2024, 1, 1, 12, 0, second) for second in range(10))
+        with patch.object(html_exporter, "datetime") as mock_datetime:
+            mock_datetime.now.side_effect = lambda: next(clock)
+            exporter.export_multiple_files(files)
+
+            pages = [self.output_dir / f"doc{i}.html" for i in range(3)]
+            pages.append(self.output_dir / "index.html")
+            for page in pages:
+                self.assertIn("RE-cue</a> on 2024-01-01 12:00:00</p>", page.read_text())
+
+            # A later single export is stamped with the current time
+            exporter.export_file(files[0])
+            self.assertIn("on 2024-01-01 12:00:01</p>", pages[0].read_text())
+
     def test_assets_created(self):
         """Test that CSS and JS assets are created."""
         md_file = self.temp_path / "test.md"
@@ -403,6 +580,25 @@ class TestHTMLExporter(unittest.TestCase):
         self.assertIn("initTheme", js_content)
         self.assertIn("initSearch", js_content)
 
+    def test_unchanged_assets_not_rewritten(self):
+        """Test that a repeat export leaves identical assets untouched."""
+        md_file = self.temp_path / "test.md"
+        md_file.write_text("# Test")
+
+        config = HTMLConfig(output_dir=self.output_dir)
+        HTMLExporter(config).export_multiple_files([md_file])
+        css_file = config.css_dir / "styles.css"
+        os.utime(css_file, ns=(0, 0))
+
+        HTMLExporter(config).export_multiple_files([md_file])
+        self.assertEqual(css_file.stat().st_mtime_ns, 0)
+
+        # A different theme color changes the stylesheet
+        config = HTMLConfig(output_dir=self.output_dir, theme_color="#ff5733")
+        HTMLExporter(config).export_multiple_files([md_file])
+        self.assertNotEqual(css_file.stat().st_mtime_ns, 0)
+        self.assertIn("#ff5733", css_file.read_text())
+
     def test_dark_mode_config(self):
         """Test dark mode configuration."""
         md_file = self.temp_path / "test.md"
@@ -425,6 +621,21 @@ class TestHTMLExporter(unittest.TestCase):
         html_content2 = result2.file_path.read_text()
         self.assertNotIn("themeToggle", html_content2)
 
+    def test_theme_applied_in_head(self):
+        """Test that the theme is set by a script in <head>, before the body renders."""
+        md_file = self.temp_path / "test.md"
+        md_file.write_text("# Test")
+
+        result = HTMLExporter(HTMLConfig(output_dir=self.output_dir)).export_file(md_file)
+        head = result.file_path.read_text().split("</head>")[0]
+        self.assertIn("setAttribute('data-theme', theme)", head)
+
+        output_dir2 = self.temp_path / "html_output2"
+        result2 = HTMLExporter(HTMLConfig(output_dir=output_dir2, dark_mode=False)).export_file(
+            md_file
+        )
+        self.assertNotIn("<script>", result2.file_path.read_text())
+
     def test_search_config(self):
         """Test search functionality configuration."""
         md_file = self.temp_path / "test.md"
@@ -481,6 +692,32 @@ class TestHTMLExporter(unittest.TestCase):
         css_content = css_file.read_text()
         self.assertIn("#ff5733", css_content)
 
+    def test_assets_minified_by_default(self):
+        """Test that assets are minified unless minify is disabled."""
+        minified = HTMLExporter(HTMLConfig(output_dir=self.output_dir))
+        readable = HTMLExporter(HTMLConfig(output_dir=self.output_dir, minify=False))
+
+        css = minified._generate_css()
+        self.assertNotIn("/*", css)
+        self.assertIn("--primary-color:#2563eb;", css)
+        self.assertIn("/* RE-cue Documentation Styles */", readable._generate_css())
+
+        javascript = minified._generate_javascript()
+        self.assertNotIn("    ", javascript)
+        self.assertIn("function initSearch()", javascript)
+        self.assertLess(len(javascript), len(readable._generate_javascript()))
+
+    def test_static_assets_shared_between_exporters(self):
+        """Test that asset text is built once, with only the theme color varying."""
+        default = HTMLExporter(HTMLConfig(output_dir=self.output_dir))
+        themed = HTMLExporter(HTMLConfig(output_dir=self.output_dir, theme_color="#ff5733"))
+
+        self.assertIs(default._generate_javascript(), themed._generate_javascript())
+        self.assertEqual(
+            default._generate_css().replace("#2563eb", "#ff5733", 1),
+            themed._generate_css(),
+        )
+
     def test_export_to_html_convenience_function(self):
         """Test convenience function for HTML export."""
         md_file = self.temp_path / "test.md"
@@ -500,5 +737,24 @@ class TestHTMLExporter(unittest.TestCase):
         self.assertTrue((self.output_dir / "index.html").exists())
 
 
+class TestExportersPackage(unittest.TestCase):
+    """Test lazy re-exports from the exporters package."""
+
+    def test_package_exports_resolve_to_module_objects(self):
+        """Test that package-level names are the exporter module's objects."""
+        import reverse_engineer.exporters as exporters
+
+        self.assertIs(exporters.HTMLExporter, HTMLExporter)
+        self.assertIs(exporters.export_to_html, export_to_html)
+        self.assertIn("JiraExporter", dir(exporters))
+
+    def test_unknown_name_raises_attribute_error(self):
+        """Test that unknown names still raise AttributeError."""
+        import reverse_engineer.exporters as exporters
+
+        with self.assertRaises(AttributeError):
+            _ = exporters.NoSuchExporter
+
+
 if __name__ == "__main__":
     unittest.main()
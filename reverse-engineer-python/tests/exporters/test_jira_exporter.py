@@ -9,6 +9,7 @@ Tests cover:
 - Error handling
 """
 
+import time
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -211,6 +212,31 @@ class TestJiraExporter(unittest.TestCase):
         self.assertIn("h3. Technical Context", description)
         self.assertIn("UserController.register()", description)
 
+    def test_use_case_to_description_skips_empty_sections(self):
+        """Test that empty sections are left out and sources are limited to five."""
+        use_case = UseCase(
+            id="UC02",
+            name="View Report",
+            primary_actor="Manager",
+            main_scenario=["Manager opens report", "System shows totals"],
+            identified_from=[f"ReportController.method{i}()" for i in range(7)],
+        )
+
+        exporter = self.JiraExporter(self.config)
+        description = exporter._use_case_to_description(use_case)
+
+        expected = [
+            "*Primary Actor:* Manager",
+            "",
+            "h3. Main Scenario",
+            "# Manager opens report",
+            "# System shows totals",
+            "",
+            "h3. Technical Context",
+            "Identified from:",
+        ] + [f"* {{code}}ReportController.method{i}(){{code}}" for i in range(5)]
+        self.assertEqual(description, "\n".join(expected))
+
     def test_create_issue_from_use_case_success(self):
         """Test successful issue creation from use case."""
         mock_client = MagicMock()
@@ -271,7 +297,9 @@ class TestJiraExporter(unittest.TestCase):
         mock_issue1.key = "PROJ-123"
         mock_issue2 = MagicMock()
         mock_issue2.key = "PROJ-124"
-        mock_client.create_issue.side_effect = [mock_issue1, mock_issue2]
+        # Issues may be created concurrently, so answer by summary, not call order
+        issues = {"Create User": mock_issue1, "Delete User": mock_issue2}
+        mock_client.create_issue.side_effect = lambda fields: issues[fields["summary"]]
         self.mock_JIRA.return_value = mock_client
 
         use_cases = [
@@ -286,6 +314,100 @@ class TestJiraExporter(unittest.TestCase):
         self.assertTrue(all(r.success for r in results))
         self.assertEqual(results[0].issue_key, "PROJ-123")
         self.assertEqual(results[1].issue_key, "PROJ-124")
+        # One client is shared by all workers
+        self.mock_JIRA.assert_called_once()
+
+    def test_export_use_cases_keeps_input_order(self):
+        """Test that results follow the input order when later issues finish first."""
+        mock_client = MagicMock()
+
+        def create_issue(fields):
+            # The first issue is the slowest to be created
+            if fields["summary"] == "Use Case 0":
+                time.sleep(0.05)
+            return MagicMock(key=f"PROJ-{fields['summary'].split()[-1]}")
+
+        mock_client.create_issue.side_effect = create_issue
+        self.mock_JIRA.return_value = mock_client
+
+        use_cases = [
+            UseCase(id=f"UC{i:02d}", name=f"Use Case {i}", primary_actor="User")
+            for i in range(5)
+        ]
+
+        self.config.max_workers = 3
+        exporter = self.JiraExporter(self.config)
+        results = exporter.export_use_cases(use_cases)
+
+        self.assertEqual([r.issue_key for r in results], [f"PROJ-{i}" for i in range(5)])
+        self.assertEqual([r.use_case_id for r in results], [uc.id for uc in use_cases])
+
+    def test_export_use_cases_bulk(self):
+        """Test bulk export maps per-issue outcomes back to use cases."""
+        mock_client = MagicMock()
+        mock_client.create_issues.return_value = [
+            {"status": "Success", "issue": MagicMock(key="PROJ-1"), "error": None},
+            {"status": "Error", "issue": None, "error": {"summary": "Summary is required"}},
+        ]
+        self.mock_JIRA.return_value = mock_client
+
+        use_cases = [
+            UseCase(id="UC01", name="Create User", primary_actor="User"),
+            UseCase(id="UC02", name="", primary_actor="Admin"),
+        ]
+
+        exporter = self.JiraExporter(self.config)
+        results = exporter.export_use_cases_bulk(use_cases)
+
+        self.assertTrue(results[0].success)
+        self.assertEqual(results[0].issue_key, "PROJ-1")
+        self.assertIn("/browse/PROJ-1", results[0].issue_url)
+        self.assertFalse(results[1].success)
+        self.assertEqual(results[1].use_case_id, "UC02")
+        self.assertIn("Summary is required", results[1].error_message)
+
+        field_list = mock_client.create_issues.call_args[1]["field_list"]
+        self.assertEqual(field_list[0]["summary"], "Create User")
+        self.assertIn("uc-uc01", field_list[0]["labels"])
+        mock_client.create_issue.assert_not_called()
+
+    def test_export_use_cases_bulk_batches_requests(self):
+        """Test bulk export sends at most 50 issues per request."""
+        mock_client = MagicMock()
+        mock_client.create_issues.side_effect = lambda field_list, prefetch: [
+            {"status": "Success", "issue": MagicMock(key=fields["summary"]), "error": None}
+            for fields in field_list
+        ]
+        self.mock_JIRA.return_value = mock_client
+
+        use_cases = [
+            UseCase(id=f"UC{i:03d}", name=f"PROJ-{i}", primary_actor="User") for i in range(120)
+        ]
+
+        exporter = self.JiraExporter(self.config)
+        results = exporter.export_use_cases_bulk(use_cases)
+
+        batch_sizes = [len(c[1]["field_list"]) for c in mock_client.create_issues.call_args_list]
+        self.assertEqual(batch_sizes, [50, 50, 20])
+        self.assertEqual([r.issue_key for r in results], [f"PROJ-{i}" for i in range(120)])
+
+    def test_export_use_cases_bulk_request_failure(self):
+        """Test a failed bulk request marks every use case in the batch as failed."""
+        mock_client = MagicMock()
+        mock_client.create_issues.side_effect = self.mock_JIRAError("Unauthorized")
+        self.mock_JIRA.return_value = mock_client
+
+        use_cases = [
+            UseCase(id="UC01", name="Create User", primary_actor="User"),
+            UseCase(id="UC02", name="Delete User", primary_actor="Admin"),
+        ]
+
+        exporter = self.JiraExporter(self.config)
+        results = exporter.export_use_cases_bulk(use_cases)
+
+        self.assertEqual(len(results), 2)
+        self.assertFalse(any(r.success for r in results))
+        self.assertIn("Unauthorized", results[1].error_message)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+"""
+Tests for the framework analyzer factory.
+"""
+
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from reverse_engineer.frameworks import BaseAnalyzer, factory
+from reverse_engineer.frameworks.go import EchoAnalyzer, GinAnalyzer
+
+
+class TestCreateAnalyzer(unittest.TestCase):
+    """Test analyzer selection by create_analyzer."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.test_path = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        """Clean up test files."""
+        shutil.rmtree(self.test_path, ignore_errors=True)
+
+    def test_repeated_calls_see_subdirectory_changes(self):
+        """Test that source and nested manifest edits change the analyzer."""
+        service = self.test_path / "svc"
+        service.mkdir()
+        (service / "go.mod").write_text("module app\nrequire github.com/gin-gonic/gin v1.9.1\n")
+        (service / "main.go").write_text('package main\n\nfunc main() { gin.GET("/", h) }\n')
+        self.assertIsInstance(factory.create_analyzer(self.test_path), GinAnalyzer)
+
+        (service / "go.mod").write_text("module app\nrequire github.com/labstack/echo v4.11.0\n")
+        (service / "main.go").write_text('package main\n\nfunc main() { echo.GET("/", h) }\n')
+        self.assertIsInstance(factory.create_analyzer(self.test_path), EchoAnalyzer)
+
+
+class TestAnalyzerRegistry(unittest.TestCase):
+    """Test the framework_id to analyzer class registry."""
+
+    def test_every_framework_resolves(self):
+        """Test that every registered framework resolves to its analyzer class."""
+        for framework_id, (_, class_name) in factory._REGISTRY.items():
+            with self.subTest(framework_id=framework_id):
+                analyzer_class = factory._analyzer_class(framework_id)
+                self.assertEqual(analyzer_class.__name__, class_name)
+                self.assertTrue(issubclass(analyzer_class, BaseAnalyzer))
+
+    def test_resolved_class_is_cached(self):
+        """Test that a resolved class is reused without importing again."""
+        factory._analyzer_class("go_echo")
+
+        with patch.object(factory.importlib, "import_module") as import_module:
+            analyzer_class = factory._analyzer_class("go_echo")
+
+        import_module.assert_not_called()
+        self.assertIs(analyzer_class, EchoAnalyzer)
+
+    def test_unknown_framework(self):
+        """Test that a framework without an analyzer resolves to None."""
+        self.assertIsNone(factory._analyzer_class("cobol"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -73,6 +73,34 @@ class TestFrameworksImports(unittest.TestCase):
         # Should be the exact same class
         self.assertIs(NewDetector, OldDetector)
 
+    def test_detectors_shim_warns_on_access(self):
+        """Test that the deprecated detectors module warns when used."""
+        import reverse_engineer.detectors as detectors
+
+        detectors.__dict__.pop("TechStack", None)
+        with self.assertWarns(DeprecationWarning):
+            from reverse_engineer.detectors import TechStack
+        self.assertIs(TechStack, detectors.TechStack)
+
+    def test_lazy_exports_resolve(self):
+        """Test that every name in __all__ resolves through the lazy imports."""
+        import reverse_engineer.frameworks as frameworks
+
+        for name in frameworks.__all__:
+            with self.subTest(name=name):
+                self.assertIn(name, dir(frameworks))
+                self.assertIsNotNone(getattr(frameworks, name))
+
+    def test_go_analyzers_import_on_access(self):
+        """Test that the Go package resolves its analyzers lazily."""
+        import reverse_engineer.frameworks.go as go
+        from reverse_engineer.frameworks.go.gin_analyzer import GinAnalyzer
+
+        self.assertIs(go.GinAnalyzer, GinAnalyzer)
+        self.assertIn("EchoAnalyzer", dir(go))
+        with self.assertRaises(AttributeError):
+            _ = go.MartiniAnalyzer
+
 
 if __name__ == '__main__':
     unittest.main()
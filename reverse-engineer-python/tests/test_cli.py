@@ -0,0 +1,456 @@
+"""Tests for CLI helper functions."""
+
+import io
+import logging
+import shutil
+import tempfile
+import unittest
+from argparse import Namespace
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+from reverse_engineer import cli
+from reverse_engineer.cli import (
+    _apply_wizard_config,
+    _default_max_workers,
+    _generate_documents,
+    _get_parser,
+    _read_batch_answers,
+    _resolve_output_dir,
+    _resolve_project_path,
+    _validate_path_string,
+    _write_static,
+    interactive_mode,
+    main,
+)
+from reverse_engineer.workflow.config_wizard import WizardConfig
+
+
+class TestParserCache(unittest.TestCase):
+    """Test reuse of the argument parser across invocations."""
+
+    def test_parser_is_reused(self):
+        """Repeated lookups return the same parser instance."""
+        self.assertIs(_get_parser(), _get_parser())
+
+    def test_cached_parser_does_not_leak_state(self):
+        """Parsing with the shared parser does not affect later parses."""
+        parser = _get_parser()
+        first = parser.parse_args(["--spec", "--format", "json"])
+        second = parser.parse_args([])
+
+        self.assertTrue(first.spec)
+        self.assertEqual(first.format, "json")
+        self.assertFalse(second.spec)
+        self.assertEqual(second.format, "markdown")
+
+    def test_invalid_choice_lists_options_in_declared_order(self):
+        """The invalid-choice error names the options in a stable order."""
+        with (
+            patch("sys.stderr", new_callable=io.StringIO) as stderr,
+            self.assertRaises(SystemExit),
+        ):
+            _get_parser().parse_args(["--diagram-type", "bogus"])
+
+        self.assertIn(
+            "argument --diagram-type: invalid choice: 'bogus' (choose from 'flowchart', "
+            "'sequence', 'component', 'er', 'architecture', 'all')",
+            stderr.getvalue(),
+        )
+
+
+class TestInteractiveBatchInput(unittest.TestCase):
+    """Test interactive mode fed from a non-TTY stdin."""
+
+    def test_read_batch_answers(self):
+        """Key/value lines are parsed, normalized, and comments skipped."""
+        lines = ["# answers", "Path: /tmp/app", "data-model: n", "", "description: a: b"]
+        answers = _read_batch_answers(lines)
+
+        self.assertEqual(answers, {"path": "/tmp/app", "data_model": "n", "description": "a: b"})
+        self.assertEqual(_read_batch_answers(["", "y", "Billing: invoices"]), {})
+
+    def test_interactive_mode_from_positional_pipe(self):
+        """Without key/value lines, each line answers the next prompt in order."""
+        stdin = io.StringIO("\ny\nn\nn\nn\nn\nn\nBilling: invoices\njson\n")
+        with (
+            patch("sys.stdin", stdin),
+            patch("builtins.input") as mock_input,
+            patch("sys.stdout", new_callable=io.StringIO),
+        ):
+            config = interactive_mode()
+
+        mock_input.assert_not_called()
+        self.assertIsNone(config.path)
+        self.assertTrue(config.spec)
+        self.assertFalse(config.plan)
+        self.assertFalse(config.quality)
+        self.assertEqual(config.description, "Billing: invoices")
+        self.assertEqual(config.format, "json")
+        self.assertFalse(config.verbose)
+
+    def test_interactive_mode_from_pipe(self):
+        """Piped answers populate the config without calling input()."""
+        stdin = io.StringIO("spec: n\nplan: n\ndata_model: n\napi_contract: n\nformat: json\n")
+        with (
+            patch("sys.stdin", stdin),
+            patch("builtins.input") as mock_input,
+            patch("sys.stdout", new_callable=io.StringIO),
+        ):
+            config = interactive_mode()
+
+        mock_input.assert_not_called()
+        self.assertIsNone(config.path)
+        self.assertFalse(config.spec)
+        self.assertFalse(config.plan)
+        self.assertTrue(config.use_cases)
+        self.assertTrue(config.quality)
+        self.assertEqual(config.format, "json")
+        self.assertFalse(config.verbose)
+
+    def test_interactive_config_matches_parser_shape(self):
+        """The returned namespace has every attribute parse_args() would set."""
+        stdin = io.StringIO("spec: n\n")
+        with patch("sys.stdin", stdin), patch("sys.stdout", new_callable=io.StringIO):
+            config = interactive_mode()
+
+        self.assertIsInstance(config, Namespace)
+        self.assertLessEqual(set(vars(_get_parser().parse_args([]))), set(vars(config)))
+        self.assertIsNone(config.output)
+        self.assertIsNone(config.template_dir)
+
+
+class TestFastExitDispatch(unittest.TestCase):
+    """Test standalone commands dispatched from main()."""
+
+    def test_list_frameworks_exits_before_analysis(self):
+        """--list-frameworks prints the framework list and returns."""
+        with (
+            patch("sys.argv", ["recue", "--list-frameworks"]),
+            patch("sys.stdout", new_callable=io.StringIO) as stdout,
+            patch("reverse_engineer.cli.ProjectAnalyzer") as mock_analyzer,
+        ):
+            main()
+
+        self.assertIn("Supported Frameworks", stdout.getvalue())
+        mock_analyzer.assert_not_called()
+
+    def test_verbose_flag_sets_cli_log_level(self):
+        """--verbose enables the CLI debug logger; it stays quiet otherwise."""
+        for argv, expected in (
+            (["recue", "--list-frameworks", "-v"], logging.DEBUG),
+            (["recue", "--list-frameworks"], logging.WARNING),
+        ):
+            with patch("sys.argv", argv), patch("sys.stdout", new_callable=io.StringIO):
+                main()
+            self.assertEqual(cli._log.level, expected)
+
+    def test_verbose_lines_go_to_current_stderr(self):
+        """Debug lines reach sys.stderr as it is when they are logged."""
+        with (
+            patch("sys.argv", ["recue", "--list-frameworks", "-v"]),
+            patch("sys.stdout", new_callable=io.StringIO),
+        ):
+            main()
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            cli._log.debug("output dir = %s", "/tmp/specs")
+
+        self.assertEqual(stderr.getvalue(), "output dir = /tmp/specs\n")
+
+    def test_phase_dispatches_to_phased_analysis(self):
+        """--phase routes to run_phased_analysis with the parsed args."""
+        with (
+            patch("sys.argv", ["recue", "--phase", "2"]),
+            patch(
+                "reverse_engineer.cli._FAST_EXIT_HANDLERS",
+                (("phase", Mock()),),
+            ) as handlers,
+        ):
+            main()
+
+        handler = handlers[0][1]
+        handler.assert_called_once()
+        self.assertEqual(handler.call_args[0][0].phase, "2")
+
+    def test_profile_management_runs_before_wizard_and_profile(self):
+        """--list-profiles returns before --wizard or --load-profile are applied."""
+        for argv in (
+            ["recue", "--wizard", "--list-profiles"],
+            ["recue", "--load-profile", "nosuch", "--list-profiles"],
+        ):
+            with (
+                self.subTest(argv=argv),
+                patch("sys.argv", argv),
+                patch(
+                    "reverse_engineer.cli._PRE_PROFILE_HANDLERS",
+                    (("list_profiles", Mock()),),
+                ) as handlers,
+                patch("reverse_engineer.config_wizard.run_wizard") as run_wizard,
+                patch("reverse_engineer.config_wizard.load_profile") as load_profile,
+            ):
+                main()
+
+            handlers[0][1].assert_called_once()
+            run_wizard.assert_not_called()
+            load_profile.assert_not_called()
+
+
+class TestResolveProjectPath(unittest.TestCase):
+    """Test project path resolution and validation."""
+
+    def setUp(self):
+        """Set up a temporary project directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.temp_path = Path(self.temp_dir)
+        cli._RESOLVED_PROJECT_PATHS.clear()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        cli._RESOLVED_PROJECT_PATHS.clear()
+
+    def test_resolves_directory(self):
+        """An existing directory resolves to its absolute path."""
+        self.assertEqual(_resolve_project_path(self.temp_dir), self.temp_path.resolve())
+
+    def test_result_is_memoized(self):
+        """A repeated lookup does not stat the filesystem again."""
+        _resolve_project_path(self.temp_dir)
+        with patch("reverse_engineer.cli.os.stat") as mock_stat:
+            _resolve_project_path(self.temp_dir)
+        mock_stat.assert_not_called()
+
+    def test_repo_root_env_var_skips_directory_walk(self):
+        """RECUE_REPO_ROOT is used when no path argument is given."""
+        with (
+            patch.dict("os.environ", {"RECUE_REPO_ROOT": self.temp_dir}),
+            patch("reverse_engineer.cli.find_repo_root") as mock_find,
+        ):
+            repo_root = _resolve_project_path(None)
+
+        self.assertEqual(repo_root, self.temp_path.resolve())
+        mock_find.assert_not_called()
+
+    def test_missing_path_exits(self):
+        """A missing path exits with an error."""
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            with self.assertRaises(SystemExit):
+                _resolve_project_path(str(self.temp_path / "missing"))
+        self.assertIn("does not exist", stderr.getvalue())
+
+    def test_null_byte_rejected_before_resolve(self):
+        """A path containing a null byte is rejected without resolving it."""
+        with (
+            patch("sys.stderr", new_callable=io.StringIO),
+            patch("reverse_engineer.cli.Path.resolve") as mock_resolve,
+        ):
+            with self.assertRaises(SystemExit):
+                _resolve_project_path("bad\0path")
+        mock_resolve.assert_not_called()
+
+    def test_validate_path_string(self):
+        """Empty and null-byte paths are reported."""
+        self.assertIsNone(_validate_path_string("src/app"))
+        self.assertEqual(_validate_path_string(""), "Path is empty")
+        self.assertEqual(_validate_path_string("a\0b"), "Path contains a null byte")
+
+    def test_non_utf8_filename_accepted(self):
+        """Filenames decoded with surrogateescape pass validation."""
+        self.assertIsNone(_validate_path_string("caf\udce9"))
+
+    def test_file_path_exits(self):
+        """A path to a regular file exits with an error."""
+        file_path = self.temp_path / "file.txt"
+        file_path.write_text("content")
+        with patch("sys.stderr", new_callable=io.StringIO) as stderr:
+            with self.assertRaises(SystemExit):
+                _resolve_project_path(str(file_path))
+        self.assertIn("not a directory", stderr.getvalue())
+
+
+class TestResolveOutputDir(unittest.TestCase):
+    """Test output directory resolution."""
+
+    def setUp(self):
+        """Set up a temporary project directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.repo_root = Path(self.temp_dir).resolve() / "myapp"
+        self.repo_root.mkdir()
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_default_output_dir(self):
+        """Without --output-dir, documents go to re-<project-name>."""
+        output_dir = _resolve_output_dir(Namespace(output_dir=None), self.repo_root)
+
+        self.assertEqual(output_dir, self.repo_root / "re-myapp")
+        self.assertTrue(output_dir.is_dir())
+
+    def test_dot_selects_project_root(self):
+        """--output-dir . writes into the project root."""
+        output_dir = _resolve_output_dir(Namespace(output_dir="."), self.repo_root)
+        self.assertEqual(output_dir, self.repo_root)
+
+    def test_explicit_output_dir(self):
+        """An explicit --output-dir is resolved and created."""
+        target = Path(self.temp_dir) / "docs" / "out"
+        output_dir = _resolve_output_dir(Namespace(output_dir=str(target)), self.repo_root)
+
+        self.assertEqual(output_dir, target.resolve())
+        self.assertTrue(output_dir.is_dir())
+
+    def test_create_false_defers_mkdir(self):
+        """With create=False the directory is resolved but not created."""
+        args = Namespace(output_dir=None)
+        output_dir = _resolve_output_dir(args, self.repo_root, create=False)
+
+        self.assertEqual(output_dir, self.repo_root / "re-myapp")
+        self.assertFalse(output_dir.exists())
+        self.assertTrue(_resolve_output_dir(args, self.repo_root).is_dir())
+
+    def test_result_is_reused(self):
+        """The resolved directory is cached on args for later steps."""
+        args = Namespace(output_dir=None)
+        first = _resolve_output_dir(args, self.repo_root)
+        args.output_dir = "."
+
+        self.assertIs(_resolve_output_dir(args, self.repo_root), first)
+
+
+class TestApplyWizardConfig(unittest.TestCase):
+    """Test copying wizard settings onto parsed arguments."""
+
+    def test_wizard_settings_override_args(self):
+        """Wizard fields are mapped onto the matching CLI attributes."""
+        args = _get_parser().parse_args([])
+        wizard_config = WizardConfig(
+            project_path="/tmp/app",
+            framework="java_spring",
+            generate_spec=False,
+            generate_use_cases=True,
+            output_format="json",
+            verbose=True,
+            custom_template_dir="/tmp/templates",
+        )
+
+        _apply_wizard_config(args, wizard_config)
+
+        self.assertEqual(args.path, "/tmp/app")
+        self.assertEqual(args.project_path, "/tmp/app")
+        self.assertEqual(args.framework, "java_spring")
+        self.assertFalse(args.spec)
+        self.assertTrue(args.use_cases)
+        self.assertEqual(args.format, "json")
+        self.assertTrue(args.verbose)
+        self.assertEqual(args.template_dir, "/tmp/templates")
+
+    def test_unset_wizard_settings_keep_cli_values(self):
+        """Fields left as None in the wizard config do not clear CLI values."""
+        args = _get_parser().parse_args(["--description", "from cli", "-o", "out"])
+
+        _apply_wizard_config(args, WizardConfig())
+
+        self.assertEqual(args.description, "from cli")
+        self.assertEqual(args.output, "out")
+
+
+class TestGenerateDocuments(unittest.TestCase):
+    """Test concurrent rendering of independent documents."""
+
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_each_document_written_to_its_file(self):
+        """Every rendered document lands in its own output file."""
+        tasks = [
+            (self.output_dir / f"doc{i}.md", lambda i=i: f"# Document {i}\n") for i in range(5)
+        ]
+
+        _generate_documents(tasks, max_workers=3)
+
+        for i in range(5):
+            self.assertEqual((self.output_dir / f"doc{i}.md").read_text(), f"# Document {i}\n")
+
+    def test_render_error_propagates(self):
+        """A failing generator raises instead of being silently dropped."""
+
+        def fail():
+            raise ValueError("render failed")
+
+        tasks = [(self.output_dir / "ok.md", lambda: "ok"), (self.output_dir / "bad.md", fail)]
+
+        with self.assertRaises(ValueError):
+            _generate_documents(tasks)
+
+
+class TestDefaultMaxWorkers(unittest.TestCase):
+    """Test the default analysis worker count."""
+
+    def test_uses_cpus_available_to_process(self):
+        """The CPU affinity mask limits the worker count."""
+        with (
+            patch("reverse_engineer.cli.os.sched_getaffinity", create=True, return_value={0, 1}),
+            patch("reverse_engineer.cli.os.cpu_count", return_value=64),
+        ):
+            self.assertEqual(_default_max_workers(), 2)
+
+    def test_capped_on_large_machines(self):
+        """Large machines are capped at 16 workers."""
+        with patch(
+            "reverse_engineer.cli.os.sched_getaffinity", create=True, return_value=set(range(64))
+        ):
+            self.assertEqual(_default_max_workers(), 16)
+
+
+class TestWriteStatic(unittest.TestCase):
+    """Test writing pre-encoded banners to stdout."""
+
+    def test_utf8_stream_receives_encoded_bytes(self):
+        """A UTF-8 stream with a buffer gets the pre-encoded bytes."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        stream.write("before\n")
+        with patch("sys.stdout", stream):
+            _write_static("═ banner\n", "═ banner\n".encode())
+        stream.flush()
+
+        self.assertEqual(raw.getvalue().decode("utf-8"), "before\n═ banner\n")
+
+    def test_explicit_stream_receives_encoded_bytes(self):
+        """A stream other than stdout, such as stderr, can be targeted."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-8")
+        stream.write("stats\n")
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            _write_static("═══\n", "═══\n".encode(), stream)
+        stream.flush()
+
+        self.assertEqual(raw.getvalue().decode("utf-8"), "stats\n═══\n")
+        self.assertEqual(stdout.getvalue(), "")
+
+    def test_text_only_stream_receives_text(self):
+        """A stream without a binary buffer gets the text."""
+        with patch("sys.stdout", new_callable=io.StringIO) as stdout:
+            _write_static("═ banner\n", b"unused")
+        self.assertEqual(stdout.getvalue(), "═ banner\n")
+
+    def test_non_utf8_stream_receives_text(self):
+        """A stream with another encoding is not sent UTF-8 bytes."""
+        raw = io.BytesIO()
+        stream = io.TextIOWrapper(raw, encoding="utf-16")
+        with patch("sys.stdout", stream):
+            _write_static("banner\n", b"unused")
+        stream.flush()
+        self.assertEqual(raw.getvalue().decode("utf-16"), "banner\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -205,6 +205,24 @@ type Product struct {
         product_model = [m for m in models if m.name == "Product"][0]
         self.assertEqual(product_model.fields, 5)
 
+    def test_discover_echo_services_from_single_walk(self):
+        """Test that services and models come from one cached file walk."""
+        (self.handlers_path / "product_handler.go").write_text("package handlers\n")
+        (self.handlers_path / "product_handler_test.go").write_text("package handlers\n")
+        nested_models = self.test_path / "internal" / "models"
+        nested_models.mkdir(parents=True)
+        (nested_models / "order.go").write_text("type Order struct {\n    ID uint\n}\n")
+
+        analyzer = EchoAnalyzer(self.test_path, verbose=False)
+        services = analyzer.discover_services()
+        go_files = analyzer._collect_go_files()
+        models = analyzer.discover_models()
+
+        self.assertEqual([s.name for s in services], ["ProductHandler"])
+        self.assertEqual([m.name for m in models], ["Order"])
+        self.assertIs(analyzer._collect_go_files(), go_files)
+        self.assertFalse(any(f.name.endswith("_test.go") for f in go_files))
+
 
 class TestFiberAnalyzer(unittest.TestCase):
     """Test Fiber framework analyzer."""
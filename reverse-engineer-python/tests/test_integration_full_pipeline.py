@@ -9,6 +9,7 @@ import unittest
 import tempfile
 import shutil
 from pathlib import Path
+from unittest.mock import patch
 from reverse_engineer.analyzer import ProjectAnalyzer
 from reverse_engineer.generators import UseCaseMarkdownGenerator
 from reverse_engineer.phase_manager import PhaseManager
@@ -231,6 +232,48 @@ public class UserControllerTest {
         user_actors = [a for a in analyzer.actors if 'USER' in a.name.upper()]
         self.assertGreater(len(user_actors), 0, "Should detect USER role")
     
+    def test_ensure_full_analysis_after_analyze(self):
+        """Test that ensure_full_analysis() does not repeat completed steps."""
+        analyzer = ProjectAnalyzer(self.project_root, verbose=False)
+        analyzer.analyze()
+        endpoint_count = analyzer.endpoint_count
+        service_count = analyzer.service_count
+
+        analyzer.ensure_full_analysis()
+
+        self.assertEqual(analyzer.endpoint_count, endpoint_count)
+        self.assertEqual(analyzer.service_count, service_count)
+
+    def test_ensure_full_analysis_skips_step_that_failed_partway(self):
+        """Test that a step that raised after collecting results is not run again."""
+        analyzer = ProjectAnalyzer(self.project_root, verbose=False)
+        analyze_controller_file = ProjectAnalyzer._analyze_controller_file
+
+        def collect_then_fail(self, file_path):
+            analyze_controller_file(self, file_path)
+            raise RuntimeError("controller parse failed")
+
+        with patch.object(ProjectAnalyzer, "_analyze_controller_file", collect_then_fail):
+            analyzer.analyze()
+        endpoints = list(analyzer.endpoints)
+        self.assertGreater(len(endpoints), 0)
+
+        analyzer.ensure_full_analysis()
+
+        self.assertEqual(analyzer.endpoints, endpoints)
+
+    def test_ensure_full_analysis_runs_missing_steps(self):
+        """Test that ensure_full_analysis() runs steps that have not run yet."""
+        analyzer = ProjectAnalyzer(self.project_root, verbose=False)
+        analyzer.discover_endpoints()
+        endpoint_count = analyzer.endpoint_count
+
+        analyzer.ensure_full_analysis()
+
+        self.assertEqual(analyzer.endpoint_count, endpoint_count)
+        self.assertGreater(analyzer.service_count, 0)
+        self.assertGreater(analyzer.use_case_count, 0)
+
     def test_use_case_enhancement_with_business_context(self):
         """Test that use cases are enhanced with business context."""
         # Initialize and analyze
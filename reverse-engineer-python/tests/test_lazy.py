@@ -0,0 +1,36 @@
+"""Tests for lazy package exports."""
+
+import unittest
+
+from reverse_engineer._lazy import lazy_exports
+
+
+class TestLazyExports(unittest.TestCase):
+    """Test the __getattr__/__dir__ hooks built by lazy_exports()."""
+
+    def setUp(self):
+        """Set up a namespace standing in for a package's globals()."""
+        self.namespace = {"__name__": "reverse_engineer.domain"}
+        self.getattr_hook, self.dir_hook = lazy_exports(
+            "reverse_engineer.domain", self.namespace, {"TechStack": ".tech_stack"}
+        )
+
+    def test_name_resolves_and_is_cached(self):
+        """Test that a lazy name is imported once and stored on the package."""
+        from reverse_engineer.domain.tech_stack import TechStack
+
+        self.assertIs(self.getattr_hook("TechStack"), TechStack)
+        self.assertIs(self.namespace["TechStack"], TechStack)
+
+    def test_unknown_name_raises(self):
+        """Test that names outside the map raise AttributeError."""
+        with self.assertRaisesRegex(AttributeError, "has no attribute 'Missing'"):
+            self.getattr_hook("Missing")
+
+    def test_dir_lists_unloaded_names(self):
+        """Test that __dir__ includes names not yet imported."""
+        self.assertEqual(self.dir_hook(), ["TechStack", "__name__"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,11 @@
 """Tests for ProjectConfig loader."""
 
 import shutil
+import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 import yaml
 
@@ -17,10 +19,12 @@ class TestProjectConfig(unittest.TestCase):
         """Set up test fixtures."""
         self.temp_dir = tempfile.mkdtemp()
         self.temp_path = Path(self.temp_dir)
+        ProjectConfig.clear_cache()
 
     def tearDown(self):
         """Clean up test fixtures."""
         shutil.rmtree(self.temp_dir, ignore_errors=True)
+        ProjectConfig.clear_cache()
 
     def test_load_minimal_config(self):
         """Test loading minimal valid config."""
@@ -197,6 +201,15 @@ impact_file: src/main.py
         config = ProjectConfig.load(config_file)
         self.assertIsNone(config)
 
+    def test_load_empty_config_skips_parser(self):
+        """Test that an empty file is not handed to the YAML parser."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text("")
+
+        with patch("yaml.load") as mock_load:
+            self.assertIsNone(ProjectConfig.load(config_file))
+        mock_load.assert_not_called()
+
     def test_load_invalid_yaml(self):
         """Test loading invalid YAML raises error."""
         config_file = self.temp_path / ".recue.yaml"
@@ -303,6 +316,42 @@ output:
         self.assertEqual(config_dict["output"]["format"], "json")
         self.assertEqual(config_dict["output"]["dir"], "./custom-output")
 
+    def test_to_dict_omits_tokens(self):
+        """Test that API tokens are not included in the dictionary."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text(
+            """
+confluence:
+  url: https://wiki.example.com
+  token: confluence-secret
+jira:
+  project: PROJ
+  token: jira-secret
+"""
+        )
+
+        config_dict = ProjectConfig.load(config_file).to_dict()
+
+        self.assertEqual(config_dict["confluence"]["url"], "https://wiki.example.com")
+        self.assertEqual(config_dict["jira"]["project"], "PROJ")
+        self.assertNotIn("token", config_dict["confluence"])
+        self.assertNotIn("token", config_dict["jira"])
+        self.assertNotIn("secret", str(config_dict))
+
+    def test_to_dict_jira_section_round_trips(self):
+        """Test that the jira section of to_dict() loads back into the same config."""
+        config = ProjectConfig(
+            jira_export=True,
+            jira_url="https://example.atlassian.net",
+            jira_user="dev@example.com",
+            jira_project="PROJ",
+            jira_issue_type="Task",
+        )
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text(yaml.safe_dump({"jira": config.to_dict()["jira"]}))
+
+        self.assertEqual(ProjectConfig.load(config_file), config)
+
     def test_partial_config(self):
         """Test loading partial config with some sections missing."""
         config_file = self.temp_path / ".recue.yaml"
@@ -369,6 +418,139 @@ analysis:
         self.assertEqual(config.max_workers, 8)
         self.assertIsInstance(config.max_workers, int)
 
+    def test_conversion_yields_exact_types(self):
+        """Test that values are converted unless already the exact type."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text(
+            """
+analysis:
+  verbose: 1
+  max_workers: true
+"""
+        )
+
+        config = ProjectConfig.load(config_file)
+        self.assertIs(config.verbose, True)
+        # bool is an int subclass, but is still converted to a plain int
+        self.assertIs(type(config.max_workers), int)
+        self.assertEqual(config.max_workers, 1)
+
+    def test_find_and_load_caches_lookup(self):
+        """Test that the directory walk runs once per start directory."""
+        (self.temp_path / ".recue.yaml").write_text("description: found\n")
+        ProjectConfig.find_and_load(self.temp_path)
+
+        with patch.object(ProjectConfig, "_config_file_in") as mock_check:
+            config = ProjectConfig.find_and_load(self.temp_path)
+
+        mock_check.assert_not_called()
+        self.assertEqual(config.description, "found")
+
+    def test_find_and_load_caches_miss(self):
+        """Test that a failed search is remembered."""
+        with patch.object(ProjectConfig, "_config_file_in", return_value=None) as mock_check:
+            self.assertIsNone(ProjectConfig.find_and_load(self.temp_path))
+            calls = mock_check.call_count
+            self.assertIsNone(ProjectConfig.find_and_load(self.temp_path))
+
+        self.assertEqual(mock_check.call_count, calls)
+
+    def test_find_and_load_sibling_reuses_parent_result(self):
+        """Test that a search from a sibling stops at the shared parent."""
+        (self.temp_path / ".recue.yaml").write_text("description: shared\n")
+        first = self.temp_path / "a"
+        second = self.temp_path / "b"
+        first.mkdir()
+        second.mkdir()
+        ProjectConfig.find_and_load(first)
+
+        with patch.object(
+            ProjectConfig, "_config_file_in", wraps=ProjectConfig._config_file_in
+        ) as mock_check:
+            config = ProjectConfig.find_and_load(second)
+
+        # Only the sibling itself is checked; the parent's result is cached
+        mock_check.assert_called_once_with(second.resolve())
+        self.assertEqual(config.description, "shared")
+
+    def test_schema_covers_every_field(self):
+        """Test that each ProjectConfig field is read from exactly one YAML key."""
+        from dataclasses import fields
+
+        from reverse_engineer.config.project_config import _SCHEMA
+
+        schema_fields = [field_name for _, _, field_name, _ in _SCHEMA]
+        self.assertEqual(sorted(schema_fields), sorted(f.name for f in fields(ProjectConfig)))
+
+    def test_non_dict_section_ignored(self):
+        """Test that a section given as a scalar is skipped."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text("generation: true\noutput:\n  format: json\n")
+
+        config = ProjectConfig.load(config_file)
+        self.assertFalse(config.generate_spec)
+        self.assertEqual(config.output_format, "json")
+
+    def test_load_utf8_config(self):
+        """Test that non-ASCII values are decoded as UTF-8."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_bytes("description: Café – Übersicht\n".encode())
+
+        config = ProjectConfig.load(config_file)
+        self.assertEqual(config.description, "Café – Übersicht")
+
+    def test_load_reuses_parsed_config(self):
+        """Test that an unchanged file is not parsed again."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text("description: cached\n")
+
+        first = ProjectConfig.load(config_file)
+        with patch("yaml.load") as mock_load:
+            second = ProjectConfig.load(config_file)
+
+        mock_load.assert_not_called()
+        self.assertIs(first, second)
+
+    def test_clear_cache_forces_reparse(self):
+        """Test that clear_cache() makes the next load parse the file again."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text("description: cached\n")
+        first = ProjectConfig.load(config_file)
+
+        ProjectConfig.clear_cache()
+        second = ProjectConfig.load(config_file)
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    @unittest.skipIf(sys.version_info < (3, 10), "dataclass slots require Python 3.10")
+    def test_config_uses_slots(self):
+        """Test that instances store fields in slots rather than a __dict__."""
+        config = ProjectConfig(description="slotted")
+
+        self.assertFalse(hasattr(config, "__dict__"))
+        self.assertIn("description", ProjectConfig.__slots__)
+
+    def test_config_is_immutable(self):
+        """Test that a loaded config cannot be modified."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text("description: shared\n")
+        config = ProjectConfig.load(config_file)
+
+        with self.assertRaises(AttributeError):
+            config.description = "changed"
+
+    def test_load_reparses_modified_file(self):
+        """Test that editing the file invalidates the cached config."""
+        config_file = self.temp_path / ".recue.yaml"
+        config_file.write_text("description: before\n")
+        ProjectConfig.load(config_file)
+
+        config_file.write_text("description: after edit\n")
+        config = ProjectConfig.load(config_file)
+
+        self.assertEqual(config.description, "after edit")
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,103 @@
+"""Tests for shared utility functions."""
+
+import shutil
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from reverse_engineer.utils import atomic_write, write_if_changed
+
+
+class TestAtomicWrite(unittest.TestCase):
+    """Test writing generated documents atomically."""
+
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.output_dir = Path(self.temp_dir)
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_writes_utf8_without_leftover_temp_file(self):
+        """The document is written as UTF-8 and the temp file is gone."""
+        target = self.output_dir / "spec.md"
+        atomic_write(target, "# Spec ✅\n")
+
+        self.assertEqual(target.read_bytes(), "# Spec ✅\n".encode())
+        self.assertEqual([p.name for p in self.output_dir.iterdir()], ["spec.md"])
+
+    def test_failed_write_keeps_previous_document(self):
+        """A failure before the rename leaves the old file untouched."""
+        target = self.output_dir / "spec.md"
+        target.write_text("old")
+
+        with patch("reverse_engineer.utils.os.replace", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                atomic_write(target, "new")
+
+        self.assertEqual(target.read_text(), "old")
+        self.assertEqual([p.name for p in self.output_dir.iterdir()], ["spec.md"])
+
+    def test_existing_file_keeps_its_mode(self):
+        """Replacing a document keeps the permissions of the old file."""
+        target = self.output_dir / "spec.md"
+        target.write_text("old")
+        target.chmod(0o640)
+
+        atomic_write(target, "new")
+
+        self.assertEqual(stat.S_IMODE(target.stat().st_mode), 0o640)
+
+    def test_symlinked_target_written_through_link(self):
+        """A symlinked document is updated at the link's destination."""
+        real = self.output_dir / "real.md"
+        real.write_text("old")
+        link = self.output_dir / "spec.md"
+        link.symlink_to(real)
+
+        atomic_write(link, "new")
+
+        self.assertTrue(link.is_symlink())
+        self.assertEqual(real.read_text(), "new")
+
+
+class TestWriteIfChanged(unittest.TestCase):
+    """Test skipping writes of unchanged documents."""
+
+    def setUp(self):
+        """Set up a temporary output directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.target = Path(self.temp_dir) / "plan.md"
+
+    def tearDown(self):
+        """Clean up the temporary directory."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_new_file_is_written(self):
+        """A missing document is created."""
+        self.assertTrue(write_if_changed(self.target, "# Plan\n"))
+        self.assertEqual(self.target.read_text(), "# Plan\n")
+
+    def test_identical_content_is_not_rewritten(self):
+        """Re-generating the same document leaves the file alone."""
+        self.target.write_text("# Plan ✅\n", encoding="utf-8")
+
+        with patch("reverse_engineer.utils.atomic_write") as mock_write:
+            self.assertFalse(write_if_changed(self.target, "# Plan ✅\n"))
+
+        mock_write.assert_not_called()
+
+    def test_changed_content_is_written(self):
+        """A document with new content replaces the old file."""
+        self.target.write_text("# Plan A\n")
+
+        self.assertTrue(write_if_changed(self.target, "# Plan B\n"))
+        self.assertEqual(self.target.read_text(), "# Plan B\n")
+
+
+if __name__ == "__main__":
+    unittest.main()